@@ -6,8 +6,11 @@ Gracefully degrades when Redis is unavailable.
 
 import os
 import json
+import time
 import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Optional, Any
 
 logger = logging.getLogger(__name__)
@@ -84,3 +87,40 @@ def get_or_compute(key: str, compute_fn, ttl: int = 300) -> Any:
     except Exception:
         pass
     return result
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds.
+
+    Used for per-worker memoization of whole responses where a Redis round
+    trip would cost more than the lookup saves.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: int = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -1,26 +1,37 @@
 from fastapi import FastAPI, Body
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal, Dict, Any, List
 from datetime import datetime, timedelta, date
+from functools import lru_cache, cached_property
+from bisect import bisect_right
+from itertools import accumulate
+from operator import itemgetter
+from types import MappingProxyType
 import swisseph as swe
-import pytz
-from dateutil import parser
 import json
 import os
 import math
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from .utils import (
-    ZODIAC_SIGNS, SIGN_LORDS, NAKSHATRAS, PLANET_IDS, COMBUSTION_DIST, PLANET_PROPS,
+    ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_ROTATIONS, SIGN_LORDS, NAKSHATRAS, PLANET_IDS, COMBUSTION_DIST, PLANET_PROPS,
     DASHA_YEARS, DASHA_SEQUENCE, TITHI_NAMES, YOGA_NAMES, KARANA_SEQUENCE,
-    to_julian, get_sign, get_nakshatra, ayanamsa_value, to_dms, get_avastha,
-    is_combust, calc_planets, calc_houses, planet_status, sunrise_sunset,
-    panchang_at_jd, compute_panchang,
+    NAK_WIDTH, NAK_NAMES, NAK_LORDS, ensure_sidereal_mode,
+    to_julian, get_timezone, parse_local, get_sign, get_nakshatra, ayanamsa_value, to_dms, get_avastha,
+    is_combust, calc_planets, calc_houses, compute_chart, planet_status, sunrise_sunset,
+    panchang_at_jd, compute_panchang, moon_sidereal, AVASTHA_COMPACT,
 )
 
 from .response import success, error
+from .cache import TTLCache
 
 from .database import init_db
 
@@ -92,6 +103,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Chart, dasha and PDF payloads are large and highly repetitive JSON/SVG, so compress anything over 1 KB
+# for clients that accept it.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 app.add_middleware(APIKeyMiddleware)
 
 # ──────── Swagger UI: API Key Input ────────
@@ -594,14 +609,15 @@ except Exception as e:
     _logging35.error(f"Failed to include CHART SPECIALIZED router: {e}")
 
 # Load Vedic properties (nakshatra table) from JSON
-def load_vedic_properties() -> Dict[str, Any]:
+def load_vedic_properties() -> MappingProxyType:
     data_path = os.path.join(os.path.dirname(__file__), 'data', 'vedic_properties.json')
     try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(data_path, 'rb') as f:
+            raw = f.read()
+        return MappingProxyType(orjson.loads(raw) if orjson else json.loads(raw))
     except Exception as e:
         logging.error(f"Failed to load vedic_properties.json: {e}")
-        return {}
+        return MappingProxyType({})
 
 NAKSHATRA_PROPERTIES = load_vedic_properties()
 
@@ -619,29 +635,47 @@ class BirthDetails(BaseModel):
     debug: Optional[bool] = Field(False, example=False)
     tropical: Optional[bool] = Field(False, example=False)
 
+    # Frozen so the parsed birth moment below cannot go stale.
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def birth_local(self) -> datetime:
+        return parse_local(self.dateOfBirth, self.timeOfBirth, self.timezone)
+
+    @cached_property
+    def jd(self) -> float:
+        return to_julian(self.dateOfBirth, self.timeOfBirth, self.timezone)
+
 
 def pd_years(years: float) -> timedelta:
     return timedelta(days=int(round(years * 365.25)))
 
 
 def parse_local_datetime(date_str: str, time_str: str, tz_name: str) -> datetime:
-    tz = pytz.timezone(tz_name)
-    dt_local = parser.parse(f"{date_str} {time_str}")
-    return tz.localize(dt_local)
+    return parse_local(date_str, time_str, tz_name)
+
 
+# Each lord's sub-period sequence starts from itself, paired with its share of the parent period.
+DASHA_ROTATIONS = {
+    lord: tuple((l, DASHA_YEARS[l] / 120.0) for l in DASHA_SEQUENCE[i:] + DASHA_SEQUENCE[:i])
+    for i, lord in enumerate(DASHA_SEQUENCE)
+}
 
+
+# Full schedules run to ~7k sookshma rows (a few MB), so keep only recent charts.
+# The returned schedule is shared between callers and must be treated as read-only.
+@lru_cache(maxsize=32)
 def vimshottari_full(jd: float, birth_dt_local: datetime) -> Dict[str, Any]:
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    ensure_sidereal_mode()
     xm, _ = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL | swe.FLG_SWIEPH)
     m_lon = xm[0]
     nk_idx = int(m_lon // 13.333333) % 27
-    start_lord = [n[1] for n in NAKSHATRAS][nk_idx]
+    start_lord = NAK_LORDS[nk_idx]
     pos_in_nk = (m_lon % 13.333333) / 13.333333
     md_years_total = DASHA_YEARS[start_lord]
     first_md_years = (1 - pos_in_nk) * md_years_total
     start_index = DASHA_SEQUENCE.index(start_lord)
     mahadashas = []
-    cursor = birth_dt_local
     md_years_list = []
     md_years_list.append((start_lord, first_md_years))
     total_years = first_md_years
@@ -658,62 +692,65 @@ def vimshottari_full(jd: float, birth_dt_local: datetime) -> Dict[str, Any]:
             if total_years >= 120 - 0.01:
                 break
 
-    def rotate_seq(start_lord: str):
-        i = DASHA_SEQUENCE.index(start_lord)
-        return DASHA_SEQUENCE[i:] + DASHA_SEQUENCE[:i]
+    # Work in whole-day offsets from the birth date: every boundary is the
+    # previous one plus a rounded day count, so no datetimes are needed until
+    # the ISO strings, which are memoised because most boundaries repeat.
+    birth_date = birth_dt_local.date()
+    iso_cache: Dict[int, str] = {}
+
+    def iso(offset: int) -> str:
+        s = iso_cache.get(offset)
+        if s is None:
+            s = iso_cache[offset] = (birth_date + timedelta(days=offset)).isoformat()
+        return s
 
-    def build_antardasha(md_start: datetime, md_years: float, md_lord: str):
+    def bounds(start: int, years) -> List[int]:
+        # Period edges as running day offsets: bounds[i] .. bounds[i + 1] spans period i.
+        return list(accumulate((int(round(y * 365.25)) for y in years), initial=start))
+
+    def build_antardasha(md_start: int, md_years: float, md_lord: str):
         antars = []
-        cursor_a = md_start
-        for ad_lord in rotate_seq(md_lord):
-            ad_years = md_years * (DASHA_YEARS[ad_lord] / 120.0)
-            ad_start = cursor_a
-            ad_end = ad_start + pd_years(ad_years)
+        ad_rot = DASHA_ROTATIONS[md_lord]
+        ad_years_list = [md_years * frac for _, frac in ad_rot]
+        ad_bounds = bounds(md_start, ad_years_list)
+        for a, (ad_lord, _) in enumerate(ad_rot):
+            ad_years = ad_years_list[a]
+            pd_rot = DASHA_ROTATIONS[ad_lord]
+            pr_years_list = [ad_years * frac for _, frac in pd_rot]
+            pd_bounds = bounds(ad_bounds[a], pr_years_list)
             pratis = []
-            cursor_p = ad_start
-            for pd_lord in rotate_seq(ad_lord):
-                pr_years = (ad_years) * (DASHA_YEARS[pd_lord] / 120.0)
-                p_start = cursor_p
-                p_end = p_start + pd_years(pr_years)
+            for k, (pd_lord, _) in enumerate(pd_rot):
                 # Build Sukshma (4th level) within each Pratyantar
-                sook_list = []
-                cursor_s = p_start
-                for sd_lord in rotate_seq(pd_lord):
-                    s_years = pr_years * (DASHA_YEARS[sd_lord] / 120.0)
-                    s_start = cursor_s
-                    s_end = s_start + pd_years(s_years)
-                    sook_list.append({
-                        'planet': sd_lord,
-                        'startDate': s_start.date().isoformat(),
-                        'endDate': s_end.date().isoformat()
-                    })
-                    cursor_s = s_end
+                sd_rot = DASHA_ROTATIONS[pd_lord]
+                pr_years = pr_years_list[k]
+                sd_bounds = bounds(pd_bounds[k], [pr_years * frac for _, frac in sd_rot])
+                sook_list = [{
+                    'planet': sd_lord,
+                    'startDate': iso(sd_bounds[j]),
+                    'endDate': iso(sd_bounds[j + 1])
+                } for j, (sd_lord, _) in enumerate(sd_rot)]
                 pratis.append({
                     'planet': pd_lord,
-                    'startDate': p_start.date().isoformat(),
-                    'endDate': p_end.date().isoformat(),
+                    'startDate': iso(pd_bounds[k]),
+                    'endDate': iso(pd_bounds[k + 1]),
                     'sookshma': sook_list
                 })
-                cursor_p = p_end
             antars.append({
                 'planet': ad_lord,
-                'startDate': ad_start.date().isoformat(),
-                'endDate': ad_end.date().isoformat(),
+                'startDate': iso(ad_bounds[a]),
+                'endDate': iso(ad_bounds[a + 1]),
                 'pratyantar': pratis
             })
-            cursor_a = ad_end
         return antars
 
-    for lord, years in md_years_list:
-        md_start = cursor
-        md_end = md_start + pd_years(years)
+    md_bounds = bounds(0, [years for _, years in md_years_list])
+    for i, (lord, years) in enumerate(md_years_list):
         mahadashas.append({
             'planet': lord,
-            'startDate': md_start.date().isoformat(),
-            'endDate': md_end.date().isoformat(),
-            'antardasha': build_antardasha(md_start, years, lord)
+            'startDate': iso(md_bounds[i]),
+            'endDate': iso(md_bounds[i + 1]),
+            'antardasha': build_antardasha(md_bounds[i], years, lord)
         })
-        cursor = md_end
 
     current = {
         'planet': start_lord,
@@ -778,6 +815,12 @@ def validate_vimshottari_schedule(schedule: Dict[str, Any]) -> Dict[str, Any]:
     return {'mdSum120': md_ok, 'adSum': ad_ok, 'pdSum': pd_ok, 'continuity': cont_ok, 'issues': issues}
 
 
+# Validation walks every MD/AD/PD row of the schedule; cache it alongside vimshottari_full (same read-only contract).
+@lru_cache(maxsize=32)
+def vimshottari_validation(jd: float, birth_dt_local: datetime) -> Dict[str, Any]:
+    return validate_vimshottari_schedule(vimshottari_full(jd, birth_dt_local))
+
+
 def modality_of(sign_index: int) -> str:
     if sign_index % 3 == 0:
         return 'Movable'
@@ -786,49 +829,55 @@ def modality_of(sign_index: int) -> str:
     return 'Dual'
 
 
-def varga_sign(lon: float, varga: int) -> Optional[str]:
+def _varga_table(step: float, bases: tuple, stride: int = 1) -> tuple:
+    return (step, stride, tuple(bases[si % len(bases)] for si in range(12)))
+
+
+# varga -> (part width in degrees, signs advanced per part, starting offset per source sign)
+VARGA_TABLES: Dict[int, tuple] = {
+    3: _varga_table(10, (0,), stride=4),
+    4: _varga_table(7.5, (0, 3, 6)),        # movable, fixed, dual
+    7: _varga_table(30/7, (0, 6)),          # odd, even
+    9: _varga_table(30/9, (0, 8, 4)),       # movable, fixed, dual
+    10: _varga_table(3, (0, 8)),            # odd, even
+    12: _varga_table(30/12, (0,)),
+}
+
+
+_LEO_IDX, _CANCER_IDX = SIGN_TO_IDX['Leo'], SIGN_TO_IDX['Cancer']
+
+
+# Keyed on the exact longitude (no rounding, so boundary placements cannot shift): repeat requests and
+# varga grids for the same birth reuse the same floats and land on a cache hit.
+@lru_cache(maxsize=16384)
+def varga_sign_index(lon: float, varga: int) -> Optional[int]:
+    """Zodiac index of the varga sign for lon, so callers placing houses can skip the name round-trip."""
     si = int(lon // 30)
     deg = lon % 30
     if varga == 2:
         odd = si % 2 == 0
-        first = 'Leo' if odd else 'Cancer'
-        second = 'Cancer' if odd else 'Leo'
+        first = _LEO_IDX if odd else _CANCER_IDX
+        second = _CANCER_IDX if odd else _LEO_IDX
         return first if deg < 15 else second
-    if varga == 3:
-        part = int(deg // 10)
-        offsets = [0, 4, 8]
-        return ZODIAC_SIGNS[(si + offsets[part]) % 12]
-    if varga == 4:
-        part = int(deg // 7.5)
-        mod = modality_of(si)
-        base = 0 if mod == 'Movable' else (3 if mod == 'Fixed' else 6)
-        return ZODIAC_SIGNS[(si + base + part) % 12]
-    if varga == 7:
-        part = int(deg // (30/7))
-        base = 0 if (si % 2 == 0) else 6
-        return ZODIAC_SIGNS[(si + base + part) % 12]
-    if varga == 9:
-        part = int(deg // (30/9))
-        mod = modality_of(si)
-        base = 0 if mod == 'Movable' else (8 if mod == 'Fixed' else 4)
-        return ZODIAC_SIGNS[(si + base + part) % 12]
-    if varga == 10:
-        part = int(deg // 3)
-        base = 0 if (si % 2 == 0) else 8
-        return ZODIAC_SIGNS[(si + base + part) % 12]
-    if varga == 12:
-        part = int(deg // (30/12))
-        return ZODIAC_SIGNS[(si + part) % 12]
+    table = VARGA_TABLES.get(varga)
+    if table is not None:
+        step, stride, base = table
+        return (si + base[si % 12] + int(deg // step) * stride) % 12
     # Generic fallback for any varga: split sign into 'varga' equal parts and advance signs sequentially
     # Note: This is a simplified/generalized mapping to support additional Varga charts when a classical rule isn't implemented.
     try:
         if varga > 1:
             step = 30.0 / float(varga)
             part = int(deg // step)
-            return ZODIAC_SIGNS[(si + part) % 12]
+            return (si + part) % 12
     except Exception:
         return None
-    return ZODIAC_SIGNS[si]
+    return si
+
+
+def varga_sign(lon: float, varga: int) -> Optional[str]:
+    idx = varga_sign_index(lon, varga)
+    return None if idx is None else ZODIAC_SIGNS[idx]
 
 
 def varga_mode(varga: int) -> str:
@@ -868,16 +917,17 @@ def charts_divisional_extended(planets: list, ascendant: Dict[str, Any]) -> Dict
             'longitude': asc_degree
         }
 
-        asc_idx = ZODIAC_SIGNS.index(asc_sign)
+        asc_idx = SIGN_TO_IDX[asc_sign]
         plist = []
         for p in planets:
-            vs = p['sign'] if d == 1 else varga_sign(p['longitude'], d)
-            if vs is None:
-                continue
             if d == 1:
+                vs = p['sign']
                 house = p.get('house') or 0
             else:
-                sidx = ZODIAC_SIGNS.index(vs)
+                sidx = varga_sign_index(p['longitude'], d)
+                if sidx is None:
+                    continue
+                vs = ZODIAC_SIGNS[sidx]
                 house = ((sidx - asc_idx + 12) % 12) + 1
             plist.append({
                 'name': p['name'],
@@ -899,23 +949,31 @@ def charts_divisional_extended(planets: list, ascendant: Dict[str, Any]) -> Dict
     return charts
 
 
-def kp_sub_lord_for(lon: float) -> str:
-    nk_start = (int(lon // 13.333333)) * 13.333333
-    pos = lon - nk_start
-    total = 13.333333
+def _kp_sub_bounds(total: float) -> tuple:
+    bounds = []
     accum = 0.0
     for lord in DASHA_SEQUENCE:
         portion = total * (DASHA_YEARS[lord] / 120.0)
-        if pos < accum + portion:
-            return lord
+        bounds.append(accum + portion)
         accum += portion
-    return DASHA_SEQUENCE[-1]
+    return tuple(bounds)
+
+
+# Upper edge of each sub-lord's span within a nakshatra, in DASHA_SEQUENCE order.
+KP_SUB_BOUNDS = _kp_sub_bounds(13.333333)
+
+
+def kp_sub_lord_for(lon: float) -> str:
+    nk_start = (int(lon // 13.333333)) * 13.333333
+    pos = lon - nk_start
+    return DASHA_SEQUENCE[min(bisect_right(KP_SUB_BOUNDS, pos), 8)]
 
 
 def kp_details(houses: list, planets: list) -> Dict[str, Any]:
     bhav = []
     for h in houses:
-        mid = (h['degree'] + 15) % 360 if isinstance(h['degree'], (int, float)) else 0
+        # calc_houses always emits a numeric degree (sign start or cusp longitude).
+        mid = (h['degree'] + 15) % 360
         bhav.append({'bhav': h['number'], 'sign': h['sign'], 'midPoint': mid, 'planets': h['planets']})
     pdetails = []
     for p in planets:
@@ -930,7 +988,7 @@ def kp_details(houses: list, planets: list) -> Dict[str, Any]:
 def detect_yogas(planets: list, houses: list, asc_sign: str) -> list:
     res = []
     pmap = {p['name']: p for p in planets}
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
 
     def in_kendra(p):
         h = p.get('house', 0)
@@ -1099,13 +1157,6 @@ def detect_yogas(planets: list, houses: list, asc_sign: str) -> list:
     if sat and moon and in_kendra(sat) and house_of(sat) == house_of(moon):
         res.append({'name': 'Punarpoo Yoga', 'description': 'Saturn-Moon conjunction in kendra - emotional depth, delays but eventual stability', 'strength': 'Mixed'})
 
-    # --- Sarpa Dosha (separate from Kaal Sarp) ---
-    if rahu and ketu:
-        classical = [pmap.get(n) for n in ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn'] if pmap.get(n)]
-        rahu_lon = rahu['longitude']
-        ketu_lon = ketu['longitude']
-        rahu_idx = next((i for i, p in enumerate(classical) if p['name'] == 'Rahu'), None)
-
     # --- Vasumad Yoga ---
     if jup and ven and in_trikona(jup) and in_trikona(ven):
         if house_of(jup) != house_of(ven):
@@ -1189,11 +1240,9 @@ def detect_doshas(planets: list) -> list:
 
     # --- Kaal Sarp Dosha (enhanced) ---
     if rahu and ketu:
-        classical = [p for p in planets if p['name'] in ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']]
+        classical = [p for p in (sun, moon, mars, mer, jup, pmap.get('Venus'), sat) if p]
         if classical:
-            rahu_lon = rahu['longitude']
-            ketu_lon = ketu['longitude']
-            lo, hi = min(rahu_lon, ketu_lon), max(rahu_lon, ketu_lon)
+            lo, hi = sorted((rahu['longitude'], ketu['longitude']))
             all_between = all(lo <= p['longitude'] <= hi for p in classical)
             all_outside = all(not (lo <= p['longitude'] <= hi) for p in classical)
             if all_between or all_outside:
@@ -1406,30 +1455,21 @@ def detect_gandmool_dosha(planets: list) -> list:
 
 
 # NEW: Function to get dynamic Vedic properties based on Moon's position
+# Indexed by ZODIAC_SIGNS position.
+TATVA_BY_SIGN = ('Fire', 'Earth', 'Air', 'Water') * 3
+PAYA_BY_SIGN = ('Gold', 'Silver', 'Copper', 'Iron', 'Copper', 'Gold',
+                'Silver', 'Iron', 'Silver', 'Copper', 'Gold', 'Iron')
+
+
 def get_vedic_properties(sign: str, nakshatra: str, pada: int) -> Dict[str, str]:
     props = NAKSHATRA_PROPERTIES.get(nakshatra, {})
     if not props:
         return {'error': 'Nakshatra properties not found'}
 
-    # Determine Tatva (Element) from Moon's sign
-    if sign in ['Aries', 'Leo', 'Sagittarius']:
-        tatva = 'Fire'
-    elif sign in ['Taurus', 'Virgo', 'Capricorn']:
-        tatva = 'Earth'
-    elif sign in ['Gemini', 'Libra', 'Aquarius']:
-        tatva = 'Air'
-    else: # Cancer, Scorpio, Pisces
-        tatva = 'Water'
-
-    # Determine Paya (Foot/Pillar) from Moon's sign
-    if sign in ['Aries', 'Virgo', 'Aquarius']:
-        paya = 'Gold'
-    elif sign in ['Taurus', 'Libra', 'Sagittarius']:
-        paya = 'Silver'
-    elif sign in ['Gemini', 'Leo', 'Capricorn']:
-        paya = 'Copper'
-    else: # Cancer, Scorpio, Pisces
-        paya = 'Iron'
+    # Tatva (Element) and Paya (Foot/Pillar) follow the Moon's sign; unknown signs fall back to Water/Iron.
+    sidx = SIGN_TO_IDX.get(sign, 3)
+    tatva = TATVA_BY_SIGN[sidx]
+    paya = PAYA_BY_SIGN[sidx]
 
     return {
         'varna': props.get('varna', 'Unknown'),
@@ -1444,20 +1484,74 @@ def get_vedic_properties(sign: str, nakshatra: str, pada: int) -> Dict[str, str]
     }
 
 
+# Whole /api/kundli payloads keyed by the serialized request; 'currentNow' is
+# date dependent and is therefore recomputed on every request.
+KUNDLI_CACHE = TTLCache(maxsize=int(os.getenv("KUNDLI_CACHE_SIZE", "64")), ttl=3600)
+
+
+def period_at(periods: List[Dict[str, Any]], when, start: str = 'startDate', end: str = 'endDate') -> Optional[Dict[str, Any]]:
+    """The period with start <= when < end. Dasha periods are contiguous and in order, so bisect on the starts."""
+    i = bisect_right(periods, when, key=itemgetter(start)) - 1
+    if i >= 0 and when < periods[i][end]:
+        return periods[i]
+    return None
+
+
+def current_dasha_now(dasha: Dict[str, Any], tz_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        today = datetime.now(get_timezone(tz_name)).date().isoformat()
+        cur_md = period_at(dasha.get('mahadashas', []), today)
+        if not cur_md:
+            return None
+        cur_ad = period_at(cur_md.get('antardasha', []), today)
+        cur_pd = period_at(cur_ad.get('pratyantar', []), today) if cur_ad else None
+        cur_sook = None
+        if cur_pd:
+            cur_sook = period_at(cur_pd.get('sookshma', []), today)
+        return {
+            'mahadasha': {'planet': cur_md['planet'], 'startDate': cur_md['startDate'], 'endDate': cur_md['endDate']},
+            'antardasha': {'planet': cur_ad['planet'], 'startDate': cur_ad['startDate'], 'endDate': cur_ad['endDate']} if cur_ad else None,
+            'pratyantar': {'planet': cur_pd['planet'], 'startDate': cur_pd['startDate'], 'endDate': cur_pd['endDate']} if cur_pd else None,
+            'sookshma': {'planet': cur_sook['planet'], 'startDate': cur_sook['startDate'], 'endDate': cur_sook['endDate']} if cur_sook else None,
+        }
+    except Exception:
+        return None
+
+
 @app.post('/api/kundli', tags=['Birth Chart'])
 def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
-    jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
+    key = body.model_dump_json()
+    payload = KUNDLI_CACHE.get(key)
+    if payload is None:
+        payload = build_kundli(body)
+        KUNDLI_CACHE.set(key, payload)
+    schedule = payload['dasha']['schedule']
+    return success({
+        **payload,
+        'dasha': {
+            'system': 'Vimshottari',
+            'currentNow': current_dasha_now(schedule, body.timezone),
+            'schedule': schedule,
+        },
+    })
+
+
+def build_kundli(body: BirthDetails) -> Dict[str, Any]:
+    jd = body.jd
     tropical = bool(body.tropical)
     ayan = ayanamsa_value(jd)
 
     planets = calc_planets(jd, body.propertyProfile, body.nodeMode, tropical=tropical)
     for p in planets:
         p['houseStatus'] = planet_status(p['name'], p['sign'])
+    pmap = {p['name']: p for p in planets}
 
     hs_code = body.houseSystem or 'W'
     house_data = calc_houses(jd, body.latitude, body.longitude, planets, hs_code, tropical=tropical)
 
-    panch = compute_panchang(body.dateOfBirth, body.timeOfBirth, body.timezone, body.latitude, body.longitude)
+    # Sidereal Sun/Moon at birth double as the panchang fallback when sunrise is unavailable.
+    birth_lons = {} if tropical else {'sun_lon': pmap['Sun']['longitude'], 'moon_lon': pmap['Moon']['longitude']}
+    panch = compute_panchang(body.dateOfBirth, body.timeOfBirth, body.timezone, body.latitude, body.longitude, **birth_lons)
 
     source = (body.propertySource or 'moon').lower()
     chosen = None
@@ -1467,15 +1561,14 @@ def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
     elif source == 'sunrisemoon':
         _sr, _ss, _sr_jd, _ = sunrise_sunset(body.dateOfBirth, body.timezone, body.latitude, body.longitude)
         sr_jd_effective = _sr_jd if _sr_jd else jd
-        xm, _ = swe.calc_ut(sr_jd_effective, swe.MOON, swe.FLG_SIDEREAL | swe.FLG_SWIEPH)
-        m_lon = xm[0]
+        m_sign, m_nak, m_pada = moon_sidereal(sr_jd_effective)
         chosen = {
-            'sign': get_sign(m_lon),
-            'nakshatra': get_nakshatra(m_lon)['name'],
-            'pada': get_nakshatra(m_lon)['pada']
+            'sign': m_sign,
+            'nakshatra': m_nak,
+            'pada': m_pada
         }
     else:
-        moon_details = next((p for p in planets if p['name'] == 'Moon'), None)
+        moon_details = pmap.get('Moon')
         if moon_details:
             chosen = {'sign': moon_details['sign'], 'nakshatra': moon_details['nakshatra'], 'pada': moon_details['nakshatraPada']}
 
@@ -1495,8 +1588,8 @@ def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
         'timezone': body.timezone,
         'ayanamsa': 'Lahiri',
         'ayanamsaValue': ayan,
-        'sunSign': next(p['sign'] for p in planets if p['name'] == 'Sun'),
-        'moonSign': next(p['sign'] for p in planets if p['name'] == 'Moon'),
+        'sunSign': pmap['Sun']['sign'],
+        'moonSign': pmap['Moon']['sign'],
         'ascendant': house_data['ascendant'],
         'houseSystem': hs_code
     }
@@ -1511,29 +1604,7 @@ def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
     doshas = detect_doshas(planets)
 
     # Vimshottari Dasha
-    birth_local = parse_local_datetime(body.dateOfBirth, body.timeOfBirth, body.timezone)
-    dasha = vimshottari_full(jd, birth_local)
-
-    # Current dasha at now
-    current_now = None
-    try:
-        tz = pytz.timezone(body.timezone)
-        today = datetime.now(tz).date().isoformat()
-        cur_md = next((md for md in dasha.get('mahadashas', []) if md['startDate'] <= today < md['endDate']), None)
-        if cur_md:
-            cur_ad = next((ad for ad in cur_md.get('antardasha', []) if ad['startDate'] <= today < ad['endDate']), None)
-            cur_pd = next((pd for pd in cur_ad.get('pratyantar', []) if pd['startDate'] <= today < pd['endDate']), None) if cur_ad else None
-            cur_sook = None
-            if cur_pd:
-                cur_sook = next((sd for sd in cur_pd.get('sookshma', []) if sd['startDate'] <= today < sd['endDate']), None)
-            current_now = {
-                'mahadasha': {'planet': cur_md['planet'], 'startDate': cur_md['startDate'], 'endDate': cur_md['endDate']},
-                'antardasha': {'planet': cur_ad['planet'], 'startDate': cur_ad['startDate'], 'endDate': cur_ad['endDate']} if cur_ad else None,
-                'pratyantar': {'planet': cur_pd['planet'], 'startDate': cur_pd['startDate'], 'endDate': cur_pd['endDate']} if cur_pd else None,
-                'sookshma': {'planet': cur_sook['planet'], 'startDate': cur_sook['startDate'], 'endDate': cur_sook['endDate']} if cur_sook else None,
-            }
-    except Exception:
-        current_now = None
+    dasha = vimshottari_full(jd, body.birth_local)
 
     # KP details
     kp = kp_details(house_data['houses'], planets)
@@ -1561,7 +1632,7 @@ def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
             'houseStatus': p['houseStatus'],
         })
 
-    return success({
+    return {
         'basicDetails': basic,
         'planets': clean_planets,
         'houses': house_data['houses'],
@@ -1570,7 +1641,6 @@ def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
         'doshas': doshas,
         'dasha': {
             'system': 'Vimshottari',
-            'currentNow': current_now,
             'schedule': dasha,
         },
         'kpDetails': kp,
@@ -1580,36 +1650,45 @@ def generate_kundli(body: BirthDetails) -> Dict[str, Any]:
             'values': vedic_props
         },
         'panchang': panch,
-    })
+    }
 
 # --------------------- New endpoint: /horoscope/planet-details ---------------------
 
-NAME_ABBR = {
+NAME_ABBR = MappingProxyType({
     'Ascendant': 'As', 'Sun': 'Su', 'Moon': 'Mo', 'Mars': 'Ma', 'Mercury': 'Me',
     'Jupiter': 'Ju', 'Venus': 'Ve', 'Saturn': 'Sa', 'Rahu': 'Ra', 'Ketu': 'Ke'
-}
+})
 
-NAKSHATRA_NAME_NORMALIZE = {
+DETAIL_PLANETS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu')
+# Response keys of the planet-details rows; '0' is the Ascendant.
+DETAIL_KEYS = tuple(str(i) for i in range(len(DETAIL_PLANETS) + 1))
+
+# Labels used in the planet-details house report (existing wording is kept for API compatibility).
+HOUSE_ORDINALS = ('1st',) + tuple(f'{h}th' for h in range(2, 13))
+
+NAKSHATRA_NAME_NORMALIZE = MappingProxyType({
     'Ashwini': 'Ashvini', 'Dhanishta': 'Dhanista', 'Shravana': 'Sravana'
-}
+})
 
 def normalize_nk(name: str) -> str:
     return NAKSHATRA_NAME_NORMALIZE.get(name, name)
 
 def sign_index(sign: str) -> int:
-    return ZODIAC_SIGNS.index(sign)
+    return SIGN_TO_IDX[sign]
 
 def rasi_no_from_sign(sign: str) -> int:
     return sign_index(sign) + 1
 
+NAKSHATRA_NUMBERS = {name: i + 1 for i, name in enumerate(NAK_NAMES)}
+
 def nakshatra_number(name: str) -> Optional[int]:
-    for i, (n, *_rest) in enumerate(NAKSHATRAS):
-        if n == name:
-            return i + 1
-    return None
+    return NAKSHATRA_NUMBERS.get(name)
 
 def avastha_compact(label: str) -> str:
     # Map 'Infant (Bala)' -> 'Bala', 'Young (Kumara)' -> 'Kumara', 'Dead (Mrita)' -> 'Mritya'
+    short = AVASTHA_COMPACT.get(label)
+    if short:
+        return short
     if 'Bala' in label and 'Infant' in label: return 'Bala'
     if 'Kumara' in label: return 'Kumara'
     if 'Yuva' in label: return 'Yuva'
@@ -1617,6 +1696,7 @@ def avastha_compact(label: str) -> str:
     if 'Mrita' in label or 'Mrity' in label: return 'Mritya'
     return label
 
+@lru_cache(maxsize=None)
 def lord_status_from_dignity(d: str) -> str:
     if d == 'Exalted':
         return 'Highly Benefic'
@@ -1683,12 +1763,10 @@ PLANET_DEFS = {
 
 @app.post('/horoscope/planet-details')
 def planet_details(body: BirthDetails):
-    import math
     # Compute base data
-    jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
-    planets = calc_planets(jd, body.propertyProfile, body.nodeMode)
     hs_code = body.houseSystem or 'W'
-    house_data = calc_houses(jd, body.latitude, body.longitude, planets, hs_code)
+    jd, planets, house_data = compute_chart(body.dateOfBirth, body.timeOfBirth, body.timezone, body.latitude,
+                                            body.longitude, body.nodeMode, hs_code, body.propertyProfile)
 
     # Build ascendant record
     asc = house_data['ascendant']
@@ -1713,56 +1791,54 @@ def planet_details(body: BirthDetails):
         'is_combust': False
     }
 
-    # Only classical + nodes in this report
-    ordered = ['Sun','Moon','Mars','Mercury','Jupiter','Venus','Saturn','Rahu','Ketu']
-    plist = [p for p in planets if p['name'] in ordered]
-    plist.sort(key=lambda p: ordered.index(p['name']))
+    # Only classical + nodes in this report, in a fixed order
+    pmap = {p['name']: p for p in planets}
+    plist = [pmap[n] for n in DETAIL_PLANETS if n in pmap]
 
     result_indexed: Dict[str, Any] = {'0': asc_item}
 
     for idx, p in enumerate(plist, start=1):
-        nk_num = nakshatra_number(p['nakshatra'])
-        dignity = planet_status(p['name'], p['sign'])
-        lord_stat = lord_status_from_dignity(dignity)
-        set_flag = bool(p.get('house', 0) in [1,2,3,4,5,6])
-        item = {
-            'name': NAME_ABBR.get(p['name'], p['name'][:2]),
-            'full_name': planet_full_name(p['name']),
-            'local_degree': p['degree'],
+        name = p['name']
+        sign = p['sign']
+        deg = p['degree']
+        nk = p['nakshatra']
+        house = p.get('house', 0)
+        result_indexed[DETAIL_KEYS[idx]] = {
+            'name': NAME_ABBR.get(name, name[:2]),
+            'full_name': name,
+            'local_degree': deg,
             'global_degree': p['longitude'],
-            'progress_in_percentage': p['degree'] / 30.0 * 100.0,
-            'rasi_no': rasi_no_from_sign(p['sign']),
-            'zodiac': p['sign'],
-            'house': p.get('house', 0),
+            'progress_in_percentage': deg / 30.0 * 100.0,
+            'rasi_no': SIGN_TO_IDX[sign] + 1,
+            'zodiac': sign,
+            'house': house,
             'speed_radians_per_day': p['speed'] * math.pi / 180.0,
             'retro': bool(p['isRetrograde']),
-            'nakshatra': normalize_nk(p['nakshatra']),
+            'nakshatra': NAKSHATRA_NAME_NORMALIZE.get(nk, nk),
             'nakshatra_lord': p['nakshatraLord'],
             'nakshatra_pada': p['nakshatraPada'],
-            'nakshatra_no': nk_num,
+            'nakshatra_no': NAKSHATRA_NUMBERS.get(nk),
             'zodiac_lord': p['signLord'],
-            'is_planet_set': set_flag,
-            'basic_avastha': avastha_compact(p.get('avastha','')),
-            'lord_status': lord_stat,
+            'is_planet_set': house in (1, 2, 3, 4, 5, 6),
+            'basic_avastha': avastha_compact(p.get('avastha', '')),
+            'lord_status': lord_status_from_dignity(planet_status(name, sign)),
             'is_combust': bool(p['isCombust'])
         }
-        result_indexed[str(idx)] = item
 
     # Personal characteristics per house (simple template-based)
     personal: list[Dict[str, Any]] = []
     asc_sign = asc['sign']
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
-    house_signs = [ZODIAC_SIGNS[(asc_idx + i) % 12] for i in range(12)]
-    pmap = {p['name']: p for p in planets}
-
-    for h in range(1, 13):
-        sign = house_signs[h-1]
+    asc_idx = SIGN_TO_IDX[asc_sign]
+    house_rows = []
+    for sign in SIGN_ROTATIONS[asc_idx]:
         lord = SIGN_LORDS[sign]
-        lord_p = pmap.get(lord)
+        house_rows.append((sign, lord, pmap.get(lord)))
+
+    for h, (sign, lord, lord_p) in enumerate(house_rows, start=1):
         lord_sign = lord_p['sign'] if lord_p else None
         lord_house = lord_p.get('house') if lord_p else None
         strength = planet_status(lord, lord_sign) if lord_sign else 'Neutral'
-        verbal = f"{h}st lord is in the {lord_house}th house" if h == 1 else f"{h}th lord is in the {lord_house}th house"
+        verbal = f"{HOUSE_ORDINALS[h - 1]} lord is in the {lord_house}th house"
         personal.append({
             'current_house': h,
             'verbal_location': verbal,
@@ -112,7 +112,7 @@ def build_navamsa_chart_section(planets: list, ascendant: dict = None) -> list:
 
     # Compute navamsa positions using varga_sign from main
     from .main import varga_sign
-    from .utils import ZODIAC_SIGNS
+    from .utils import ZODIAC_SIGNS, SIGN_TO_IDX
     nav_planets = []
     navamsa_map = {}
     for p in planets:
@@ -126,12 +126,12 @@ def build_navamsa_chart_section(planets: list, ascendant: dict = None) -> list:
     asc_degree = (ascendant or {}).get('degree', 0)
     asc_nav_sign = varga_sign(asc_degree, 9) or navamsa_map.get('Sun', ZODIAC_SIGNS[0])
 
-    nav_asc_idx = ZODIAC_SIGNS.index(asc_nav_sign) if asc_nav_sign in ZODIAC_SIGNS else 0
+    nav_asc_idx = SIGN_TO_IDX.get(asc_nav_sign, 0)
     for p in planets:
         if p['name'] not in navamsa_map:
             continue
         vsign = navamsa_map[p['name']]
-        sign_idx = ZODIAC_SIGNS.index(vsign) if vsign in ZODIAC_SIGNS else 0
+        sign_idx = SIGN_TO_IDX.get(vsign, 0)
         house = ((sign_idx - nav_asc_idx + 12) % 12) + 1
         nav_planets.append({
             'name': p['name'],
@@ -984,7 +984,7 @@ def build_major_charts_svg_section(planets: list, asc_sign: str, asc_degree: flo
     elements.append(section_divider())
 
     from .main import varga_sign, VARGA_META
-    from .utils import ZODIAC_SIGNS
+    from .utils import ZODIAC_SIGNS, SIGN_TO_IDX
 
     moon_sign = ''
     for p in planets:
@@ -1037,7 +1037,7 @@ def build_major_charts_svg_section(planets: list, asc_sign: str, asc_degree: flo
             asc_sign_d = asc_sign_d or asc_sign
 
             vplanets = []
-            asc_idx = ZODIAC_SIGNS.index(asc_sign_d)
+            asc_idx = SIGN_TO_IDX[asc_sign_d]
             for p in planets:
                 if d == 1:
                     vsign = p.get('sign', '')
@@ -1046,7 +1046,7 @@ def build_major_charts_svg_section(planets: list, asc_sign: str, asc_degree: flo
                     vsign = varga_sign(lon, d) if lon else p.get('sign', '')
                 if not vsign:
                     continue
-                sidx = ZODIAC_SIGNS.index(vsign)
+                sidx = SIGN_TO_IDX[vsign]
                 house = ((sidx - asc_idx + 12) % 12) + 1
                 vplanets.append({
                     'name': p['name'],
@@ -1525,7 +1525,7 @@ def build_shadbala_section(planets: list) -> list:
     elements.append(colored_heading('27. Shadbala (Six-fold Planetary Strength)', PRIMARY, 14))
     elements.append(section_divider())
 
-    from .utils import planet_status, ZODIAC_SIGNS, PLANET_PROPS
+    from .utils import planet_status, ZODIAC_SIGNS, SIGN_TO_IDX, PLANET_PROPS
 
     pmap = {p['name']: p for p in planets}
     planet_order = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
@@ -1564,7 +1564,7 @@ def build_shadbala_section(planets: list) -> list:
         uchcha = _uchcha_bala(p)
         house = p.get('house', 1) or 1
         kendra_bala = 60 if house in (1, 4, 7, 10) else (30 if house in (2, 5, 8, 11) else 15)
-        ojha = 15 if ZODIAC_SIGNS.index(sign) % 2 == 0 else 0 if sign else 7
+        ojha = 15 if SIGN_TO_IDX[sign] % 2 == 0 else 0 if sign else 7
         saptavargaja = sum([60, 45, 30, 15, 0, 0, 0][:1])  # simplified
         drekkana = 15 if house in (1, 5, 9) else (10 if house in (2, 6, 10) else 5)
         return round((uchcha + kendra_bala + ojha + drekkana) * 1.85, 2)
@@ -1708,10 +1708,10 @@ def build_char_dasha_section(planets: list, ascendant: dict) -> list:
     ))
     elements.append(Spacer(1, 8))
 
-    from .utils import ZODIAC_SIGNS, SIGN_LORDS
+    from .utils import ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS
 
     asc_sign = ascendant.get('sign', '')
-    asc_idx = ZODIAC_SIGNS.index(asc_sign) if asc_sign in ZODIAC_SIGNS else 0
+    asc_idx = SIGN_TO_IDX.get(asc_sign, 0)
 
     chara_years = {}
     pmap = {p['name']: p for p in planets}
@@ -1720,7 +1720,7 @@ def build_char_dasha_section(planets: list, ascendant: dict) -> list:
         lord_p = pmap.get(lord, {})
         lord_house = lord_p.get('house', ((i - asc_idx + 12) % 12) + 1)
         # MD duration = number of signs from this sign to its lord's position
-        lord_sign_idx = ZODIAC_SIGNS.index(lord_p.get('sign', sign)) if lord_p.get('sign', '') in ZODIAC_SIGNS else i
+        lord_sign_idx = SIGN_TO_IDX[lord_p.get('sign', sign)] if lord_p.get('sign', '') in ZODIAC_SIGNS else i
         distance = (lord_sign_idx - i + 12) % 12
         if distance == 0:
             distance = 12
@@ -1765,13 +1765,13 @@ def build_sade_sati_section(planets: list) -> list:
     ))
     content.append(Spacer(1, 6))
 
-    from .utils import ZODIAC_SIGNS
+    from .utils import ZODIAC_SIGNS, SIGN_TO_IDX
 
     if moon and sat:
         moon_sign = moon.get('sign', '')
         sat_sign = sat.get('sign', '')
-        moon_idx = ZODIAC_SIGNS.index(moon_sign) if moon_sign in ZODIAC_SIGNS else 0
-        sat_idx = ZODIAC_SIGNS.index(sat_sign) if sat_sign in ZODIAC_SIGNS else 0
+        moon_idx = SIGN_TO_IDX.get(moon_sign, 0)
+        sat_idx = SIGN_TO_IDX.get(sat_sign, 0)
         diff = (sat_idx - moon_idx) % 12
 
         phase = ''
@@ -1831,12 +1831,12 @@ def build_varshaphal_section(planets: list, ascendant: dict) -> list:
 
     sun = next((p for p in planets if p['name'] == 'Sun'), None)
     asc_sign = ascendant.get('sign', '')
-    from .utils import ZODIAC_SIGNS, SIGN_LORDS
-    asc_idx = ZODIAC_SIGNS.index(asc_sign) if asc_sign in ZODIAC_SIGNS else 0
+    from .utils import ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS
+    asc_idx = SIGN_TO_IDX.get(asc_sign, 0)
 
     if sun:
         sun_sign = sun.get('sign', '')
-        sun_sign_idx = ZODIAC_SIGNS.index(sun_sign) if sun_sign in ZODIAC_SIGNS else 0
+        sun_sign_idx = SIGN_TO_IDX.get(sun_sign, 0)
         muntha_house = ((sun_sign_idx - asc_idx + 12) % 12) + 1
 
         data = {
@@ -2362,7 +2362,7 @@ def build_planet_analysis_section(planets: list, houses: list, ascendant: dict)
     elements.append(section_divider())
     content = []
 
-    from .utils import ZODIAC_SIGNS, SIGN_LORDS, planet_status, PLANET_PROPS
+    from .utils import ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS, planet_status, PLANET_PROPS
 
     PLANET_DOMAIN = {
         'Sun': 'Authority, vitality, ego, father, leadership',
@@ -2391,7 +2391,7 @@ def build_planet_analysis_section(planets: list, houses: list, ascendant: dict)
     }
 
     asc_sign = ascendant.get('sign', '')
-    asc_idx = ZODIAC_SIGNS.index(asc_sign) if asc_sign in ZODIAC_SIGNS else 0
+    asc_idx = SIGN_TO_IDX.get(asc_sign, 0)
 
     for p in planets:
         if p['name'] in ['Uranus', 'Neptune', 'Pluto']:
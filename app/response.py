@@ -1,5 +1,31 @@
-from typing import Any, Dict, Optional
-from fastapi.responses import JSONResponse
+from typing import Any, Callable, Dict, Optional
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from . import cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# For large computed payloads (dasha schedules): returning a response directly skips FastAPI's
+# jsonable_encoder walk, and orjson does the dump in C when it is installed.
+FastJSONResponse = ORJSONResponse if orjson else JSONResponse
+
+
+def cached_json(key: str, build: Callable[[], Any], ttl: int = 86400) -> Response:
+    """FastJSONResponse for build(), with the encoded body shared across workers in Redis.
+
+    Hits are returned as stored, with no recompute or re-encode. If Redis is down,
+    the body is built every time.
+    """
+    body = cache.get(key)
+    if body is not None:
+        return Response(content=body, media_type='application/json')
+    resp = FastJSONResponse(build())
+    cache.set(key, resp.body.decode(), ttl)
+    return resp
 
 
 def success(data: Any = None, message: str = "Success", status_code: int = 200) -> JSONResponse:
@@ -6,7 +6,7 @@ import json
 import swisseph as swe
 import pytz
 from ..utils import (to_julian, calc_planets, calc_houses, get_sign, get_nakshatra,
-                     ZODIAC_SIGNS, SIGN_LORDS, PLANET_PROPS, planet_status)
+                     SIGN_TO_IDX, SIGN_LORDS, PLANET_PROPS, planet_status)
 
 router = APIRouter()
 
@@ -728,8 +728,8 @@ def ai_marriage_analysis(body: CompatRequest, request: Request = None):
         user_prompt = f"Person 1 Chart:\n{ctx1}\n\nPerson 2 Chart:\n{ctx2}\n\nProvide detailed marriage compatibility analysis."
         ai_text, err = _call_ai_provider(user_id, system_prompt, user_prompt)
         if ai_text:
-            mi1=ZODIAC_SIGNS.index(m1) if m1 in ZODIAC_SIGNS else 0
-            mi2=ZODIAC_SIGNS.index(m2) if m2 in ZODIAC_SIGNS else 0
+            mi1=SIGN_TO_IDX.get(m1, 0)
+            mi2=SIGN_TO_IDX.get(m2, 0)
             diff=(mi2-mi1)%12
             return {'status':200,'response':{'compatibilityAnalysis':ai_text,'source':'ai',
                     'person1':{'ascendant':a1['sign'],'moonSign':m1},
@@ -738,8 +738,8 @@ def ai_marriage_analysis(body: CompatRequest, request: Request = None):
 
     P:List[str]=[]
     P.append(f"MARRIAGE COMPATIBILITY\nPerson 1: Asc {a1['sign']}, Moon {m1}.\nPerson 2: Asc {a2['sign']}, Moon {m2}.")
-    mi1=ZODIAC_SIGNS.index(m1) if m1 in ZODIAC_SIGNS else 0
-    mi2=ZODIAC_SIGNS.index(m2) if m2 in ZODIAC_SIGNS else 0
+    mi1=SIGN_TO_IDX.get(m1, 0)
+    mi2=SIGN_TO_IDX.get(m2, 0)
     diff=(mi2-mi1)%12
     if diff in (0,4,6,8):
         P.append(f"Moon compatibility: {'EXCELLENT' if diff==0 else 'GOOD'} \u2014 {diff} signs apart, {'strong harmony' if diff==0 else 'complementary energies'}.")
@@ -3,7 +3,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import swisseph as swe
 
-from ..utils import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_LORDS, planet_status
+from ..utils import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS, planet_status
 
 router = APIRouter()
 
@@ -294,7 +294,7 @@ def calculate_ashtakavarga(req: PlanetStrengthRequest):
     house_data = calc_houses(jd, req.latitude, req.longitude, planets, hs_code)
 
     asc_sign = house_data['ascendant']['sign']
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
     av_points = calculate_ashtakavarga_points(planets, asc_idx)
 
     total_points = sum(h['points'] for h in av_points)
@@ -37,8 +37,8 @@ def generate_chart(body: ChartRequest):
                 nav_planets.append({'name': p['name'], 'sign': vsign, 'degree': p['degree'],
                                     'isRetrograde': p.get('isRetrograde', False), 'isCombust': p.get('isCombust', False), 'house': 0})
         asc_nav = {'sign': varga_sign(asc['degree'], 9) or asc['sign'], 'degree': 0}
-        from .chart_svg import render_svg
-        svg_str = render_svg(body.width, body.height, asc_nav, nav_planets, theme='light', show_degrees=False)
+        from .chart_svg import render_svg_bytes
+        svg = render_svg_bytes(body.width, body.height, asc_nav, nav_planets, theme='light', show_degrees=False)
     elif body.chartType == 'ashtakavarga':
         from ..main import compute_ashtakavarga
         av = compute_ashtakavarga(planets)
@@ -48,8 +48,8 @@ def generate_chart(body: ChartRequest):
         return JSONResponse({'charts': svgs})
     else:
         asc_dict = {'sign': asc['sign'], 'degree': 0, 'nakshatra': '', 'nakshatraLord': '', 'nakshatraPada': 1}
-        from .chart_svg import render_svg
-        svg_str = render_svg(body.width, body.height, asc_dict, planets, theme='light', show_degrees=False)
+        from .chart_svg import render_svg_bytes
+        svg = render_svg_bytes(body.width, body.height, asc_dict, planets, theme='light', show_degrees=False)
 
     from fastapi.responses import HTMLResponse
-    return HTMLResponse(content=svg_str, media_type='image/svg+xml')
+    return HTMLResponse(content=svg, media_type='image/svg+xml')
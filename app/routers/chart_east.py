@@ -4,6 +4,8 @@ from typing import Optional, Dict, Any
 import svgwrite
 from io import StringIO
 
+from .chart_svg import ring_offsets
+
 
 router = APIRouter()
 
@@ -54,9 +56,8 @@ CELLS_BY_INDEX = {v: k for k, v in EAST_SIGN_CELLS.items()}
 
 def _east_house_from_asc(asc_sign: str):
     """Return a list of 12 entries mapping house number to sign, starting from ascendant."""
-    from ..main import ZODIAC_SIGNS
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
-    return [(i + 1, ZODIAC_SIGNS[(asc_idx + i) % 12]) for i in range(12)]
+    from ..main import SIGN_TO_IDX, SIGN_ROTATIONS
+    return list(enumerate(SIGN_ROTATIONS[SIGN_TO_IDX[asc_sign]], start=1))
 
 
 def _render_east_svg(width: int, height: int, asc: dict, planets: list, theme: str = 'light') -> str:
@@ -151,7 +152,7 @@ def _render_east_svg(width: int, height: int, asc: dict, planets: list, theme: s
 
 def _render_moon_svg(width: int, height: int, asc: dict, moon_sign: str, planets: list, theme: str = 'light') -> str:
     """Render a diamond North-Indian style chart but with Moon's sign as house 1."""
-    from ..main import ZODIAC_SIGNS
+    from ..main import SIGN_TO_IDX
 
     HOUSE_POLYGONS = {
         1: [(100, 225), (200, 300), (300, 225), (200, 150)],
@@ -199,8 +200,7 @@ def _render_moon_svg(width: int, height: int, asc: dict, moon_sign: str, planets
         g.add_stop_color(1, '#f0f3bf', opacity=0.0)
     dwg.defs.add(g)
 
-    moon_idx = ZODIAC_SIGNS.index(moon_sign)
-    house_signs = [ZODIAC_SIGNS[(moon_idx + i) % 12] for i in range(12)]
+    moon_idx = SIGN_TO_IDX[moon_sign]
 
     for h in range(1, 13):
         pts = [sp(p) for p in HOUSE_POLYGONS[h]]
@@ -215,23 +215,23 @@ def _render_moon_svg(width: int, height: int, asc: dict, moon_sign: str, planets
     by_house = {i: [] for i in range(1, 13)}
     for p in planets:
         p_sign = p.get('sign', '')
-        p_sign_idx = ZODIAC_SIGNS.index(p_sign) if p_sign in ZODIAC_SIGNS else 0
+        p_sign_idx = SIGN_TO_IDX.get(p_sign, 0)
         h = ((p_sign_idx - moon_idx + 12) % 12) + 1
         p['_moon_house'] = h
         by_house[h].append(p)
 
-    import math
     radius = 20 * min(scale_x, scale_y)
     for h in range(1, 13):
         center = sp(HOUSE_CENTERS[h])
         hplanets = by_house[h]
+        ring = ring_offsets(len(hplanets))
         for j, planet in enumerate(hplanets):
             if len(hplanets) == 1:
                 px, py = center
             else:
-                angle = 2 * math.pi * j / len(hplanets)
-                px = center[0] + radius * math.cos(angle)
-                py = center[1] + radius * math.sin(angle)
+                cos_a, sin_a = ring[j]
+                px = center[0] + radius * cos_a
+                py = center[1] + radius * sin_a
             abbr = PLANET_ABBR.get(planet['name'], planet['name'][:2])
             color = PLANET_COLORS.get(planet['name'], '#000000')
             retro = planet.get('isRetrograde', False)
@@ -248,7 +248,7 @@ def _render_moon_svg(width: int, height: int, asc: dict, moon_sign: str, planets
 
 
 @router.post('/east-svg', response_class=Response)
-async def east_svg(req: EastChartRequest):
+def east_svg(req: EastChartRequest):
     from ..main import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS
     jd = to_julian(req.dateOfBirth, req.timeOfBirth, req.timezone)
     planets = calc_planets(jd, None, req.nodeMode or 'mean')
@@ -261,7 +261,7 @@ async def east_svg(req: EastChartRequest):
 
 
 @router.post('/moon-svg', response_class=Response)
-async def moon_svg(req: EastChartRequest):
+def moon_svg(req: EastChartRequest):
     from ..main import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS
     jd = to_julian(req.dateOfBirth, req.timeOfBirth, req.timezone)
     planets = calc_planets(jd, None, req.nodeMode or 'mean')
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Response
 from pydantic import BaseModel, Field
 from typing import Optional
+from functools import lru_cache
+
+from .chart_svg import deg_label
 
 
 router = APIRouter()
@@ -20,108 +23,106 @@ class GridChartRequest(BaseModel):
     theme: Optional[str] = Field('light', example='light')  # currently used only for colors
 
 
+GRID_ABBR = {
+    'Ascendant': 'As', 'Sun': 'Su', 'Moon': 'Mo', 'Mars': 'Ma', 'Mercury': 'Me', 'Jupiter': 'Ju', 'Venus': 'Ve',
+    'Saturn': 'Sa', 'Rahu': 'Ra', 'Ketu': 'Ke', 'Uranus': 'Ur', 'Neptune': 'Ne', 'Pluto': 'Pl'
+}
+
+# Border/grid lines on the 500x500 base canvas
+GRID_LINES = (
+    (1.5, 0, 1.5, 500), (125, 0, 125, 500), (0, 498, 500, 498), (375, 500, 375, 0),
+    (498, 500, 498, 0), (0, 1.5, 500, 1.5), (0, 125, 500, 125), (0, 375, 500, 375),
+    (0, 250, 125, 250), (375, 250, 500, 250), (250, 0, 250, 125), (250, 375, 250, 500),
+)
+
+# Positions for 12 signs (clockwise as per example). We'll show degree and sign name similar to sample.
+# Order in the sample appears as 1st row (between x=125..375): Aries, Taurus, Gemini
+GRID_CELL_POSITIONS = (
+    (177.5, 62.5, 172.5, 115),   # Aries (row1,col2)
+    (302.5, 62.5, 294.5, 115),   # Taurus (row1,col3)
+    (427.5, 62.5, 419.5, 115),   # Gemini (row1,col4)
+    (427.5, 187.5, 419.5, 240),  # Cancer
+    (427.5, 312.5, 428.5, 365),  # Leo
+    (427.5, 437.5, 422.5, 490),  # Virgo
+    (302.5, 437.5, 297.5, 490),  # Libra
+    (177.5, 437.5, 166.5, 490),  # Scorpio
+    (55.5, 437.5, 32.5, 490),    # Sagittarius
+    (55.5, 312.5, 38.5, 365),    # Capricorn
+    (55.5, 187.5, 41.5, 240),    # Aquarius
+    (55.5, 65.5, 47.5, 118),     # Pisces
+)
+
+_TEXT_STYLE = "font-family: '','Lucida Sans', 'Lucida Grande', 'Lucida Sans Unicode', Geneva, Verdana, sans-serif;display:flex;justify-content:center;align-items:center;"
+
+
 def _line(x1, y1, x2, y2, color="#ff3366", w=3):
     return f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke:{color};stroke-width:{w}" />'
 
 
-def _text(x, y, content, fill, size, opacity=None):
-    style = "font-family: '','Lucida Sans', 'Lucida Grande', 'Lucida Sans Unicode', Geneva, Verdana, sans-serif;display:flex;justify-content:center;align-items:center;"
-    if opacity is not None:
-        style += f"opacity:{opacity};"
-    return f'<text x="{x}" y= "{y}" style = "{style}fill:{fill};font-size:{size}px; ">{content}</text>'
+# Text rows step down from each cell's anchor by this gap (px at 500x500, scaled with height)
+GRID_LINE_GAP = 18
 
 
-def render_grid_svg(width: int, height: int, cell_lines: list[list[str]]) -> str:
+@lru_cache(maxsize=64)
+def _grid_layout(width: int, height: int) -> tuple:
+    """UTF-8 opening tag with scaled grid lines, plus per-cell `<text x=.. y=..` heads for each row a cell can hold."""
     # Based on the provided example, draw a 500x500 grid scaled to dimensions
-    W, H = 500, 500
-    sx, sy = width / W, height / H
-
-    def scx(x):
-        return round(x * sx, 2)
-
-    def scy(y):
-        return round(y * sy, 2)
-
+    sx, sy = width / 500, height / 500
     orange = '#ff3366'
-    svg = [f'<svg height="{height}" width="{width}" xmlns="http://www.w3.org/2000/svg">']
-    # Border/grid lines (scaled)
-    svg.append(_line(scx(1.5), scy(0), scx(1.5), scy(500), orange))
-    svg.append(_line(scx(125), scy(0), scx(125), scy(500), orange))
-    svg.append(_line(scx(0), scy(498), scx(500), scy(498), orange))
-    svg.append(_line(scx(375), scy(500), scx(375), scy(0), orange))
-    svg.append(_line(scx(498), scy(500), scx(498), scy(0), orange))
-    svg.append(_line(scx(0), scy(1.5), scx(500), scy(1.5), orange))
-    svg.append(_line(scx(0), scy(125), scx(500), scy(125), orange))
-    svg.append(_line(scx(0), scy(375), scx(500), scy(375), orange))
-    svg.append(_line(scx(0), scy(250), scx(125), scy(250), orange))
-    svg.append(_line(scx(375), scy(250), scx(500), scy(250), orange))
-    svg.append(_line(scx(250), scy(0), scx(250), scy(125), orange))
-    svg.append(_line(scx(250), scy(375), scx(250), scy(500), orange))
-
-    # Positions for 12 signs (clockwise as per example). We'll show degree and sign name similar to sample.
-    # Order in the sample appears as 1st row (between x=125..375): Aries, Taurus, Gemini
-    # We'll compute sign labels from ascendant and fill degrees from sign_degrees[1..12]
-    def positions():
-        return [
-            (177.5, 62.5, 172.5, 115),   # Aries (row1,col2)
-            (302.5, 62.5, 294.5, 115),   # Taurus (row1,col3)
-            (427.5, 62.5, 419.5, 115),   # Gemini (row1,col4)
-            (427.5, 187.5, 419.5, 240),  # Cancer
-            (427.5, 312.5, 428.5, 365),  # Leo
-            (427.5, 437.5, 422.5, 490),  # Virgo
-            (302.5, 437.5, 297.5, 490),  # Libra
-            (177.5, 437.5, 166.5, 490),  # Scorpio
-            (55.5, 437.5, 32.5, 490),    # Sagittarius
-            (55.5, 312.5, 38.5, 365),    # Capricorn
-            (55.5, 187.5, 41.5, 240),    # Aquarius
-            (55.5, 65.5, 47.5, 118),     # Pisces
-        ]
-
-    # Text color styles
-    text_fill = '#222222'
-    # Draw planet lines per cell (e.g., "Su 10.2°", "Mo 23.4°")
-    line_gap = 18  # base gap in px at 500x500; will scale with sy
-    for i, (dx, dy, _sx, _sy) in enumerate(positions(), start=0):
-        lines = cell_lines[i] if i < len(cell_lines) else []
-        for j, content in enumerate(lines):
-            y = dy + j * line_gap
-            svg.append(_text(scx(dx), scy(y), content, text_fill, 16))
-
-    svg.append('</svg>')
-    return ''.join(svg)
+    lines = ''.join(
+        _line(round(x1 * sx, 2), round(y1 * sy, 2), round(x2 * sx, 2), round(y2 * sy, 2), orange)
+        for x1, y1, x2, y2 in GRID_LINES
+    )
+    frame = (f'<svg height="{height}" width="{width}" xmlns="http://www.w3.org/2000/svg">' + lines).encode()
+    # At most one row per GRID_ABBR entry (Ascendant plus every body) lands in a single cell.
+    cell_heads = tuple(
+        tuple(f'<text x="{round(dx * sx, 2)}" y= "{round((dy + j * GRID_LINE_GAP) * sy, 2)}'
+              for j in range(len(GRID_ABBR)))
+        for dx, dy, _lx, _ly in GRID_CELL_POSITIONS
+    )
+    return frame, cell_heads
+
+
+# Nearly every request uses the default canvas, so build its layout at import.
+_grid_layout(500, 500)
+
+
+@lru_cache(maxsize=16)
+def _text_style_tail(fill: str, size: int) -> str:
+    return f'" style = "{_TEXT_STYLE}fill:{fill};font-size:{size}px; ">'
+
+
+def render_grid_svg(width: int, height: int, cell_lines: list[list[str]]) -> bytes:
+    frame, cell_heads = _grid_layout(width, height)
+    # Draw planet lines per cell (e.g., "Su 10.2°", "Mo 23.4°"); every line shares one style,
+    # so the attribute tail is formatted once: <text x=".." y= ".." style = "...">label</text>.
+    style_tail = _text_style_tail('#222222', 16)
+    texts = ''.join(
+        f'{head}{style_tail}{content}</text>'
+        for heads, lines in zip(cell_heads, cell_lines)
+        for head, content in zip(heads, lines)
+    )
+    # The static frame is already encoded; only the labels (which carry '°') need encoding here.
+    return frame + texts.encode() + b'</svg>'
 
 
 @router.post('/grid-svg', response_class=Response)
 def chart_grid_svg(body: GridChartRequest):
     # Import locally to avoid circulars at module import time
-    from ..main import to_julian, calc_planets, calc_houses
-
-    SIGNS = ['Aries','Taurus','Gemini','Cancer','Leo','Virgo','Libra','Scorpio','Sagittarius','Capricorn','Aquarius','Pisces']
-    ABR = {
-        'Ascendant':'As','Sun':'Su','Moon':'Mo','Mars':'Ma','Mercury':'Me','Jupiter':'Ju','Venus':'Ve','Saturn':'Sa','Rahu':'Ra','Ketu':'Ke','Uranus':'Ur','Neptune':'Ne','Pluto':'Pl'
-    }
+    from ..main import compute_chart, SIGN_TO_IDX
 
     # Compute planets and ascendant
-    jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
-    planets = calc_planets(jd, None, body.nodeMode or 'mean')
-    house_data = calc_houses(jd, body.latitude, body.longitude, planets, body.houseSystem or 'W')
+    jd, planets, house_data = compute_chart(body.dateOfBirth, body.timeOfBirth, body.timezone, body.latitude,
+                                            body.longitude, body.nodeMode or 'mean', body.houseSystem or 'W')
     asc_sign = house_data['ascendant']['sign']
     asc_deg_local = float(house_data['ascendant']['degree']) % 30.0
 
-    # Group planets by sign with degrees
-    sign_map = {s: [] for s in SIGNS}
+    # One cell per sign in South-Indian fixed placement order (Aries..Pisces), Ascendant first
+    cell_lines = [[] for _ in range(12)]
+    cell_lines[SIGN_TO_IDX[asc_sign]].append(f"{GRID_ABBR['Ascendant']} {deg_label(asc_deg_local)}")
     for p in planets:
-        sign = p.get('sign')
-        deg = p.get('degree')
-        name = p.get('name')
-        if sign in sign_map and isinstance(deg, (int, float)) and name:
-            sign_map[sign].append(f"{ABR.get(name, name[:2])} {deg:.1f}°")
-
-    # Add Ascendant to its sign at the top
-    sign_map[asc_sign].insert(0, f"{ABR['Ascendant']} {asc_deg_local:.1f}°")
-
-    # Maintain South-Indian fixed sign placement order (Aries..Pisces)
-    cell_lines = [sign_map[s] for s in SIGNS]
+        name = p['name']
+        cell_lines[SIGN_TO_IDX[p['sign']]].append(f"{GRID_ABBR.get(name, name[:2])} {deg_label(p['degree'])}")
 
     svg = render_grid_svg(body.width or 500, body.height or 500, cell_lines)
     return Response(content=svg, media_type='image/svg+xml')
@@ -9,6 +9,8 @@ import svgwrite
 import math
 from io import StringIO
 
+from .chart_svg import ring_offsets, deg_label
+
 router = APIRouter()
 
 PLANET_ABBR = {
@@ -91,24 +93,24 @@ def _render_diamond_svg(width, height, asc_sign, planets_by_house, title_text, t
         dwg.add(dwg.text(str(h), insert=pos, font_size='14px', fill=tc, font_weight='bold'))
 
     # Planets
-    import math as _m
     radius = 20 * min(scale_x, scale_y)
     for h in range(1, 13):
         center = sp(HOUSE_CENTERS[h])
         hplanets = planets_by_house.get(h, [])
+        ring = ring_offsets(len(hplanets))
         for j, planet in enumerate(hplanets):
             if len(hplanets) == 1:
                 px, py = center
             else:
-                angle = 2 * _m.pi * j / len(hplanets)
-                px = center[0] + radius * _m.cos(angle)
-                py = center[1] + radius * _m.sin(angle)
+                cos_a, sin_a = ring[j]
+                px = center[0] + radius * cos_a
+                py = center[1] + radius * sin_a
             abbr = PLANET_ABBR.get(planet['name'], planet['name'][:2])
             color = PLANET_COLORS.get(planet['name'], '#000000')
             retro = planet.get('isRetrograde', False)
             label = f"{abbr}{'®' if retro else ''}"
             dwg.add(dwg.text(label, insert=(px, py), font_size='14px', fill=color, font_weight='bold', text_anchor='middle'))
-            deg = f"{planet.get('degree', 0):.1f}°"
+            deg = deg_label(planet.get('degree', 0))
             dwg.add(dwg.text(deg, insert=(px, py + 14 * scale_y), font_size='11px', fill=color, text_anchor='middle'))
 
     # Title
@@ -138,7 +140,7 @@ class DedicatedChartRequest(BaseModel):
              summary="Navamsa (D9) Chart SVG",
              description="Generate the Navamsa chart — the most important divisional chart, showing marriage, dharma, and spiritual strength. Each sign is divided into 9 equal parts (10° each).")
 def navamsa_chart_svg(req: DedicatedChartRequest):
-    from ..main import to_julian, calc_planets, calc_houses, varga_sign, ZODIAC_SIGNS
+    from ..main import to_julian, calc_planets, calc_houses, varga_sign, varga_sign_index, ZODIAC_SIGNS, SIGN_TO_IDX
 
     jd = to_julian(req.dateOfBirth, req.timeOfBirth, req.timezone)
     planets = calc_planets(jd, None, req.nodeMode or 'mean')
@@ -147,16 +149,16 @@ def navamsa_chart_svg(req: DedicatedChartRequest):
     # Navamsa ascendant
     asc_degree = natal['ascendant']['degree']
     asc_sign = varga_sign(asc_degree, 9) or natal['ascendant']['sign']
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
 
     # Build navamsa planets
     by_house = {i: [] for i in range(1, 13)}
     planet_details = []
     for p in planets:
-        vsign = varga_sign(p['longitude'], 9)
-        if not vsign:
+        sidx = varga_sign_index(p['longitude'], 9)
+        if sidx is None:
             continue
-        sidx = ZODIAC_SIGNS.index(vsign)
+        vsign = ZODIAC_SIGNS[sidx]
         house = ((sidx - asc_idx + 12) % 12) + 1
         entry = {
             'name': p['name'],
@@ -192,7 +194,7 @@ def navamsa_chart_svg(req: DedicatedChartRequest):
              summary="Hora (D2) Chart SVG",
              description="Generate the Hora chart — used for analyzing wealth and financial prospects. Each sign is divided into 2 equal parts (15° each): odd signs get Sun's hora (Leo), even signs get Moon's hora (Cancer).")
 def hora_chart_svg(req: DedicatedChartRequest):
-    from ..main import to_julian, calc_planets, calc_houses, varga_sign, ZODIAC_SIGNS
+    from ..main import to_julian, calc_planets, calc_houses, varga_sign, varga_sign_index, ZODIAC_SIGNS, SIGN_TO_IDX
 
     jd = to_julian(req.dateOfBirth, req.timeOfBirth, req.timezone)
     planets = calc_planets(jd, None, req.nodeMode or 'mean')
@@ -200,15 +202,15 @@ def hora_chart_svg(req: DedicatedChartRequest):
 
     asc_degree = natal['ascendant']['degree']
     asc_sign = varga_sign(asc_degree, 2) or natal['ascendant']['sign']
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
 
     by_house = {i: [] for i in range(1, 13)}
     planet_details = []
     for p in planets:
-        vsign = varga_sign(p['longitude'], 2)
-        if not vsign:
+        sidx = varga_sign_index(p['longitude'], 2)
+        if sidx is None:
             continue
-        sidx = ZODIAC_SIGNS.index(vsign)
+        vsign = ZODIAC_SIGNS[sidx]
         house = ((sidx - asc_idx + 12) % 12) + 1
         entry = {
             'name': p['name'],
@@ -259,8 +261,7 @@ class SudarshanaRequest(BaseModel):
              summary="Sudarshana Chakra (Transit Overlay) SVG",
              description="Generate the Sudarshana Chakra — a three-layered wheel showing Rasi, Navamsa, and Transit (current) positions overlaid. Shows how transits affect your natal chart.")
 def sudarshana_chakra_svg(req: SudarshanaRequest):
-    from ..main import to_julian, calc_planets, calc_houses, varga_sign, ZODIAC_SIGNS
-    import pytz
+    from ..main import to_julian, calc_planets, calc_houses, varga_sign, ZODIAC_SIGNS, SIGN_TO_IDX, get_timezone
     from datetime import datetime
 
     # Natal chart
@@ -270,12 +271,11 @@ def sudarshana_chakra_svg(req: SudarshanaRequest):
     asc_natal = natal['ascendant']
 
     # Transit chart
-    tz = pytz.timezone(req.timezone)
     if req.transitDate:
         transit_date = req.transitDate
         transit_time = req.transitTime or '12:00'
     else:
-        now = datetime.now(tz)
+        now = datetime.now(get_timezone(req.timezone))
         transit_date = now.strftime('%Y-%m-%d')
         transit_time = now.strftime('%H:%M')
 
@@ -288,18 +288,18 @@ def sudarshana_chakra_svg(req: SudarshanaRequest):
 
     # Build three layers for each planet
     layers = []
-    asc_idx = ZODIAC_SIGNS.index(asc_natal['sign'])
+    asc_idx = SIGN_TO_IDX[asc_natal['sign']]
     for p in planets_natal:
         if p['name'] not in PLANET_ABBR:
             continue
         # Rasi layer
         rasi_sign = p['sign']
-        rasi_house = ((ZODIAC_SIGNS.index(rasi_sign) - asc_idx + 12) % 12) + 1
+        rasi_house = ((SIGN_TO_IDX[rasi_sign] - asc_idx + 12) % 12) + 1
 
         # Navamsa layer
         nav_sign = varga_sign(p['longitude'], 9) or rasi_sign
-        nav_asc_idx = ZODIAC_SIGNS.index(asc_navamsa_sign)
-        nav_house = ((ZODIAC_SIGNS.index(nav_sign) - nav_asc_idx + 12) % 12) + 1
+        nav_asc_idx = SIGN_TO_IDX[asc_navamsa_sign]
+        nav_house = ((SIGN_TO_IDX[nav_sign] - nav_asc_idx + 12) % 12) + 1
 
         # Transit layer
         transit_p = next((tp for tp in planets_transit if tp['name'] == p['name']), None)
@@ -352,7 +352,6 @@ def sudarshana_chakra_svg(req: SudarshanaRequest):
         dwg.add(dwg.text(str(h_num), insert=pos, font_size='14px', fill=tc, font_weight='bold'))
 
     # Place planets with three lines each (Rasi / Navamsa / Transit)
-    import math as _m
     radius = 20 * min(scale_x, scale_y)
     for layer in layers:
         h_num = layer['rasi']['house']
@@ -368,9 +367,9 @@ def sudarshana_chakra_svg(req: SudarshanaRequest):
         if n == 1:
             px, py = center
         else:
-            angle = 2 * _m.pi * idx / n
-            px = center[0] + radius * _m.cos(angle)
-            py = center[1] + radius * _m.sin(angle)
+            cos_a, sin_a = ring_offsets(n)[idx]
+            px = center[0] + radius * cos_a
+            py = center[1] + radius * sin_a
 
         # Three-line display: Rasi sign / Navamsa sign / Transit sign
         rasi_label = f"{abbr}{retro}"
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Response
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
-import svgwrite
+from functools import lru_cache
 import math
-from io import StringIO
+from xml.sax.saxutils import escape
+
+from ..utils import TimezoneName, SIGN_TO_IDX
 
 router = APIRouter()
 
@@ -13,7 +15,7 @@ class ChartRequest(BaseModel):
     timeOfBirth: str = Field(..., example="14:30")
     latitude: float = Field(..., example=28.6139)
     longitude: float = Field(..., example=77.2090)
-    timezone: str = Field(..., example="Asia/Kolkata")
+    timezone: TimezoneName = Field(..., example="Asia/Kolkata")
     houseSystem: Optional[str] = Field('W', example='W')
     nodeMode: Optional[str] = Field('mean', example='mean')
     # Rendering options
@@ -23,7 +25,7 @@ class ChartRequest(BaseModel):
     includeOuterPlanets: Optional[bool] = Field(True, example=True)
     stackIfCountAtLeast: Optional[int] = Field(3, example=3, description='If a house has >= this many planets, stack them vertically with degrees to the side')
 
-# North Indian Chart Generator using svgwrite
+# North Indian Chart Generator
 # Proper polygon-based houses with gradient backgrounds
 
 PLANET_ABBR = {
@@ -93,98 +95,141 @@ def scale_point(point, scale_x, scale_y):
     return (point[0] * scale_x, point[1] * scale_y)
 
 
-def render_svg(width: int, height: int, asc: dict, planets: list, theme: str = 'light', include_outer: bool = True, stack_mode: Optional[str] = None, stack_threshold: int = 3, show_degrees: bool = True, show_retrograde: bool = True):
-    """Generate North Indian chart using svgwrite with proper polygon houses."""
-    from ..main import ZODIAC_SIGNS
-    
-    # Create drawing
-    dwg = svgwrite.Drawing(size=(width, height), profile='full')
-    dwg.attribs['viewBox'] = f'0 0 {width} {height}'
-    dwg.attribs['xmlns'] = 'http://www.w3.org/2000/svg'
-    
+# SVG markup is written directly as strings, in the same form svgwrite (profile='full') produced:
+# attributes sorted by name and numbers rendered with str().
+_SVG_OPEN = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg baseProfile="full" height="{1}" version="1.1" viewBox="0 0 {0} {1}" width="{0}" '
+    'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink">'
+)
+
+# Background gradient stops per theme: (color1, opacity1, color2, opacity2); transparent by default
+GRADIENT_THEMES = {
+    'opaque-light': ('white', 1.0, '#f0f3bf', 1.0),
+    'opaque-dark': ('#1a1a2e', 1.0, '#16213e', 1.0),
+    'dark': ('#1a1a2e', 0.15, '#16213e', 0.08),
+}
+DEFAULT_GRADIENT = ('white', 0.0, '#f0f3bf', 0.0)
+
+
+def _svg_polygon(points, fill, stroke, stroke_width) -> str:
+    pts = ' '.join('%s,%s' % p for p in points)
+    return f'<polygon fill="{fill}" points="{pts}" stroke="{stroke}" stroke-width="{stroke_width}" />'
+
+
+def _svg_text(content: str, x, y, font_size: str, fill: str, font_weight: str, text_anchor: Optional[str] = None) -> str:
+    anchor = f' text-anchor="{text_anchor}"' if text_anchor else ''
+    return (f'<text fill="{fill}" font-size="{font_size}" font-weight="{font_weight}"{anchor} x="{x}" y="{y}">'
+            f'{escape(content)}</text>')
+
+
+# Houses holding n planets stack them with (line step in base px, font size), indexed by min(n, 5)
+STACK_STEPS = (None, (14, 13), (16, 11), (14, 10), (12, 9), (11, 8))
+
+
+@lru_cache(maxsize=32)
+def _scaled_geometry(width: int, height: int) -> tuple:
+    """House polygons markup plus scaled label positions and stack line steps for one canvas size."""
     # Calculate scaling factors (base chart is 400x300)
     scale_x = width / 400
     scale_y = height / 300
-    
-    # Full background rect to ensure borders are fully visible
-    dwg.add(svgwrite.shapes.Rect(
-        insert=(0, 0), size=(width, height),
-        fill='none', stroke='none'
-    ))
+    polygons = ''.join(
+        _svg_polygon([scale_point(p, scale_x, scale_y) for p in HOUSE_POLYGONS[house_num]], 'url(#grad)', '#8B4513', 2)
+        for house_num in range(1, 13)
+    )
+    house_no_pos = tuple(scale_point(HOUSE_NO_POS[house_num], scale_x, scale_y) for house_num in range(1, 13))
+    centers = tuple(scale_point(HOUSE_CENTERS[house_num], scale_x, scale_y) for house_num in range(1, 13))
+    line_steps = (None,) + tuple(step * min(scale_x, scale_y) for step, _font in STACK_STEPS[1:])
+    asc_pos = scale_point((200, 18), scale_x, scale_y)
+    return polygons, house_no_pos, centers, line_steps, asc_pos
+
+
+# "d.d°" labels for every tenth of a degree within a sign (30.0 covers values that round up)
+_DEG_1DP = tuple(f"{i / 10:.1f}°" for i in range(301))
+
+
+def deg_label(x: float) -> str:
+    """Same text as f"{x:.1f}°"; in-sign values are looked up, anything else is formatted."""
+    t = x * 10
+    if 0.0 <= t < 300.49:
+        i = round(t)
+        # Values this close to a .x5 boundary could round either way, so leave them to format()
+        if abs(t - i) < 0.49:
+            return _DEG_1DP[i]
+    return f"{x:.1f}°"
+
+
+@lru_cache(maxsize=16)
+def ring_offsets(n: int) -> tuple:
+    """Unit (cos, sin) offsets that space n labels evenly round a house centre."""
+    return tuple((math.cos(2 * math.pi * j / n), math.sin(2 * math.pi * j / n)) for j in range(n))
+
+
+@lru_cache(maxsize=32)
+def _chart_template(theme: str, width: int, height: int) -> str:
+    """Chart markup up to the planet labels for one theme and canvas size; house sign numbers are {0}..{11}."""
+    polygons, house_no_pos, _centers, _line_steps, _asc_pos = _scaled_geometry(width, height)
+    out = [_SVG_OPEN.format(width, height)]
 
     # Add gradient (transparent by default)
-    def _add_gradient(dwg, color1, opacity1, color2, opacity2):
-        g = svgwrite.gradients.LinearGradient(start=(0, 0), end=(0, 1), id="grad")
-        g.add_stop_color(0, color1, opacity=opacity1)
-        g.add_stop_color(1, color2, opacity=opacity2)
-        dwg.defs.add(g)
-
-    if theme == 'opaque-light':
-        _add_gradient(dwg, 'white', 1.0, '#f0f3bf', 1.0)
-    elif theme == 'opaque-dark':
-        _add_gradient(dwg, '#1a1a2e', 1.0, '#16213e', 1.0)
-    elif theme == 'dark':
-        _add_gradient(dwg, '#1a1a2e', 0.15, '#16213e', 0.08)
-    else:
-        _add_gradient(dwg, 'white', 0.0, '#f0f3bf', 0.0)
-    
-    # Get ascendant house mapping
-    asc_sign = asc.get('sign')
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
-    
+    color1, opacity1, color2, opacity2 = GRADIENT_THEMES.get(theme, DEFAULT_GRADIENT)
+    out.append(
+        '<defs><linearGradient id="grad" x1="0" x2="0" y1="0" y2="1">'
+        f'<stop offset="0" stop-color="{color1}" stop-opacity="{opacity1}" />'
+        f'<stop offset="1" stop-color="{color2}" stop-opacity="{opacity2}" />'
+        '</linearGradient></defs>'
+    )
+
+    # Full background rect to ensure borders are fully visible
+    out.append(f'<rect fill="none" height="{height}" stroke="none" width="{width}" x="0" y="0" />')
+
+    # Draw house polygons with increased stroke for visibility
+    out.append(polygons)
+
+    # House sign number slots, filled per chart
+    text_color = '#006666' if theme == 'light' else '#66cccc'
+    for i, pos in enumerate(house_no_pos):
+        out.append(_svg_text('{%d}' % i, pos[0], pos[1], '14px', text_color, 'bold'))
+    return ''.join(out)
+
+
+@lru_cache(maxsize=128)
+def _chart_frame(theme: str, width: int, height: int, asc_idx: int) -> bytes:
+    """UTF-8 chart frame (everything but the planet labels) for an ascendant sign index."""
     # House numbers relative to ascendant (ascendant is always in house 1)
     # North Indian style: house numbers are zodiac signs starting from ascendant
     house_sign_nums = [((asc_idx + i) % 12) + 1 for i in range(12)]
-    
-    # Draw house polygons with increased stroke for visibility
-    for house_num in range(1, 13):
-        points = [scale_point(p, scale_x, scale_y) for p in HOUSE_POLYGONS[house_num]]
-        polygon = svgwrite.shapes.Polygon(points, fill="url(#grad)", stroke='#8B4513', stroke_width=2)
-        dwg.add(polygon)
-    
-    # Add house sign numbers
-    text_color = '#006666' if theme == 'light' else '#66cccc'
-    for house_num in range(1, 13):
-        pos = scale_point(HOUSE_NO_POS[house_num], scale_x, scale_y)
-        sign_num = house_sign_nums[house_num - 1]
-        text = dwg.text(str(sign_num), insert=pos, font_size='14px', fill=text_color, font_weight='bold')
-        dwg.add(text)
+    return _chart_template(theme, width, height).format(*house_sign_nums).encode()
+
+
+def render_svg_bytes(width: int, height: int, asc: dict, planets: list, theme: str = 'light', include_outer: bool = True, stack_mode: Optional[str] = None, stack_threshold: int = 3, show_degrees: bool = True, show_retrograde: bool = True) -> bytes:
+    """Generate North Indian chart SVG with proper polygon houses, as UTF-8 bytes ready to send."""
+    _polygons, _house_no_pos, centers, line_steps, asc_pos = _scaled_geometry(width, height)
+
+    # Get ascendant house mapping
+    asc_sign = asc.get('sign')
+    frame = _chart_frame(theme, width, height, SIGN_TO_IDX[asc_sign])
+    out = []
     
     # Group planets by house
     outer = {'Uranus', 'Neptune', 'Pluto'}
-    by_house = {i: [] for i in range(1, 13)}
+    by_house = {}
     for p in planets:
         if not include_outer and p['name'] in outer:
             continue
         h = int(p.get('house', 0))
         if 1 <= h <= 12:
-            by_house[h].append(p)
+            by_house.setdefault(h, []).append(p)
     
-    # Add planets to houses
-    radius = 18 * min(scale_x, scale_y)
-    line_step = 14 * min(scale_x, scale_y)
-    for house_num in range(1, 13):
-        center = scale_point(HOUSE_CENTERS[house_num], scale_x, scale_y)
+    # Add planets to occupied houses, in house order
+    for house_num in sorted(by_house):
         house_planets = by_house[house_num]
-        
-        if not house_planets:
-            continue
-
+        center = centers[house_num - 1]
         n = len(house_planets)
         # Use vertical stacking for 2+ planets, scaled font for 4+
-        font_size = 13
-        if n >= 5:
-            line_step = 11 * min(scale_x, scale_y)
-            font_size = 8
-        elif n >= 4:
-            line_step = 12 * min(scale_x, scale_y)
-            font_size = 9
-        elif n >= 3:
-            line_step = 14 * min(scale_x, scale_y)
-            font_size = 10
-        elif n >= 2:
-            line_step = 16 * min(scale_x, scale_y)
-            font_size = 11
+        line_step = line_steps[min(n, 5)]
+        font_size = STACK_STEPS[min(n, 5)][1]
 
         deg_font_size = max(7, font_size - 2)
 
@@ -199,26 +244,28 @@ def render_svg(width: int, height: int, asc: dict, planets: list, theme: str = '
             else:
                 abbr_label = abbr
             if show_degrees:
-                deg = f"{planet['degree']:.1f}°"
+                deg = deg_label(planet['degree'])
                 inline_label = f"{abbr_label} {deg}"
-                dwg.add(dwg.text(inline_label, insert=(center[0], y), font_size=f'{deg_font_size}px', fill=color, font_weight='bold', text_anchor='middle'))
+                out.append(_svg_text(inline_label, center[0], y, f'{deg_font_size}px', color, 'bold', 'middle'))
             else:
-                dwg.add(dwg.text(abbr_label, insert=(center[0], y), font_size=f'{font_size}px', fill=color, font_weight='bold', text_anchor='middle'))
+                out.append(_svg_text(abbr_label, center[0], y, f'{font_size}px', color, 'bold', 'middle'))
     
     # Add ascendant marker (small, only visible on standard charts)
     asc_deg_global = asc.get('degree', 0)
     asc_deg_local = (asc_deg_global % 30) if isinstance(asc_deg_global, (int, float)) else 0
-    asc_text = f"Asc {asc_deg_local:.1f}°"
-    asc_pos = scale_point((200, 18), scale_x, scale_y)
-    dwg.add(dwg.text(asc_text, insert=asc_pos, font_size='9px', fill='#666', font_weight='normal', text_anchor='middle'))
-    
-    # Convert to string
-    output = StringIO()
-    dwg.write(output)
-    return output.getvalue()
+    asc_text = f"Asc {deg_label(asc_deg_local)}"
+    out.append(_svg_text(asc_text, asc_pos[0], asc_pos[1], '9px', '#666', 'normal', 'middle'))
+    out.append('</svg>')
+    # The frame is already encoded; only the labels (which carry '°' and '®') need encoding here.
+    return frame + ''.join(out).encode()
+
+
+def render_svg(*args, **kwargs) -> str:
+    """render_svg_bytes as text, for callers that embed the chart (PDF sections)."""
+    return render_svg_bytes(*args, **kwargs).decode()
 
 @router.post('/svg', response_class=Response)
-async def chart_svg(req: ChartRequest):
+def chart_svg(req: ChartRequest):
     """
     Generate SVG chart by computing planets/houses from birth details (no precomputed data).
     """
@@ -232,7 +279,7 @@ async def chart_svg(req: ChartRequest):
     theme = (req.theme or 'light').lower()
     include_outer = bool(req.includeOuterPlanets) if req.includeOuterPlanets is not None else True
 
-    svg = render_svg(width, height, house_data['ascendant'], planets, theme=theme, include_outer=include_outer, stack_threshold=int(req.stackIfCountAtLeast or 3))
+    svg = render_svg_bytes(width, height, house_data['ascendant'], planets, theme=theme, include_outer=include_outer, stack_threshold=int(req.stackIfCountAtLeast or 3))
     return Response(content=svg, media_type='image/svg+xml')
 
 # ---------------- Divisional Chart (Varga) SVG ----------------
@@ -243,7 +290,7 @@ class DivisionalChartRequest(BaseModel):
     timeOfBirth: str = Field(..., example="14:30")
     latitude: float = Field(..., example=28.6139)
     longitude: float = Field(..., example=77.2090)
-    timezone: str = Field(..., example="Asia/Kolkata")
+    timezone: TimezoneName = Field(..., example="Asia/Kolkata")
     nodeMode: Optional[str] = Field('mean', example='mean')
     width: Optional[int] = Field(800, example=800)
     height: Optional[int] = Field(600, example=600)
@@ -267,7 +314,7 @@ def _parse_varga_name(name: str) -> Optional[int]:
              summary="Divisional Chart SVG (D1-D60)",
              description="Generate any of the 60 divisional charts as SVG. Classical vargas: D1 (Rasi), D2 (Hora), D3 (Drekkana), D4 (Chaturthamsa), D7 (Saptamsa), D9 (Navamsa), D10 (Dashamamsa), D12 (Dwadasamsa), D16 (Shodasamsa), D20 (Vimsamsa), D24 (Siddhamsa), D27 (Nakshatramsa), D30 (Trimshamsa), D40 (Khavedamsa), D45 (Akshavedamsa), D60 (Shashtiamsa).")
 def divisional_chart_svg(req: DivisionalChartRequest):
-    from ..main import to_julian, calc_planets, calc_houses, varga_sign, ZODIAC_SIGNS
+    from ..main import to_julian, calc_planets, calc_houses, varga_sign, varga_sign_index, ZODIAC_SIGNS
 
     d = _parse_varga_name(req.name)
     # Allow any Dn using generic fallback if not classical
@@ -291,13 +338,13 @@ def divisional_chart_svg(req: DivisionalChartRequest):
     }
 
     # Build varga planets with houses relative to varga ascendant (whole-sign)
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
     vplanets = []
     for p in planets:
-        vsign = p['sign'] if d == 1 else varga_sign(p['longitude'], d)
-        if not vsign:
+        sidx = SIGN_TO_IDX[p['sign']] if d == 1 else varga_sign_index(p['longitude'], d)
+        if sidx is None:
             continue
-        sidx = ZODIAC_SIGNS.index(vsign)
+        vsign = ZODIAC_SIGNS[sidx]
         house = ((sidx - asc_idx + 12) % 12) + 1
         vplanets.append({
             'name': p['name'],
@@ -314,7 +361,7 @@ def divisional_chart_svg(req: DivisionalChartRequest):
     theme = (req.theme or 'light').lower()
     include_outer = bool(req.includeOuterPlanets) if req.includeOuterPlanets is not None else True
 
-    svg = render_svg(width, height, asc, vplanets, theme=theme, include_outer=include_outer, stack_mode='vertical', stack_threshold=int(req.stackIfCountAtLeast or 2), show_degrees=False, show_retrograde=True)
+    svg = render_svg_bytes(width, height, asc, vplanets, theme=theme, include_outer=include_outer, stack_mode='vertical', stack_threshold=int(req.stackIfCountAtLeast or 2), show_degrees=False, show_retrograde=True)
 
     # Chart name
     try:
@@ -361,20 +408,13 @@ def render_ashtakavarga_svg(width: int, height: int, bindu_data: dict, planet_na
     """Render a single Ashtakavarga chart in North Indian diamond style.
     Simple transparent background, black text points, no house numbers.
     bindu_data: dict of {house_num: bindu_count}."""
-    dwg = svgwrite.Drawing(size=(width, height), profile='full')
-    dwg.attribs['viewBox'] = f'0 0 {width} {height}'
-    dwg.attribs['xmlns'] = 'http://www.w3.org/2000/svg'
+    out = [_SVG_OPEN.format(width, height), '<defs />']
 
     scale_x = width / 400
     scale_y = height / 300
 
     # Title
-    dwg.add(dwg.text(
-        planet_name,
-        insert=(width / 2, 20),
-        font_size='16px', font_weight='bold',
-        fill='#333', text_anchor='middle'
-    ))
+    out.append(_svg_text(planet_name, width / 2, 20, '16px', '#333', 'bold', 'middle'))
 
     def sp(point):
         return (point[0] * scale_x, 30 + point[1] * (height - 60) / 270)
@@ -382,27 +422,16 @@ def render_ashtakavarga_svg(width: int, height: int, bindu_data: dict, planet_na
     # Draw house polygons - transparent fill, thin grey stroke
     for h_num in range(1, 13):
         pts_poly = [sp(p) for p in HOUSE_POLYGONS[h_num]]
-        polygon = svgwrite.shapes.Polygon(
-            pts_poly,
-            fill='none',
-            stroke='#999', stroke_width=0.8
-        )
-        dwg.add(polygon)
+        out.append(_svg_polygon(pts_poly, 'none', '#999', 0.8))
 
     # Bindu counts only at house centers (no house numbers)
     for h_num in range(1, 13):
         center = sp(HOUSE_CENTERS[h_num])
         pts = bindu_data.get(h_num, 0)
-        dwg.add(dwg.text(
-            str(pts),
-            insert=(center[0], center[1] + 2),
-            font_size='16px', font_weight='bold',
-            fill='#000', text_anchor='middle'
-        ))
-
-    output = StringIO()
-    dwg.write(output)
-    return output.getvalue()
+        out.append(_svg_text(str(pts), center[0], center[1] + 2, '16px', '#000', 'bold', 'middle'))
+
+    out.append('</svg>')
+    return ''.join(out)
 
 
 def render_all_ashtakavarga_svgs(width: int, height: int, ashtakavarga_data: dict, theme: str = 'light') -> list:
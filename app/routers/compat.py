@@ -212,7 +212,7 @@ def _nadi_score(male_nakshatra: str, female_nakshatra: str) -> Dict[str, Any]:
 
 @router.post('/compat')
 def kundli_matching(body: CompatRequest) -> Dict[str, Any]:
-    from ..main import (to_julian, calc_planets, calc_houses, ZODIAC_SIGNS,
+    from ..main import (to_julian, calc_planets, calc_houses, SIGN_TO_IDX,
                         get_nakshatra, SIGN_LORDS)
 
     jd_male = to_julian(body.maleDateOfBirth, body.maleTimeOfBirth, body.maleTimezone)
@@ -232,8 +232,8 @@ def kundli_matching(body: CompatRequest) -> Dict[str, Any]:
 
     male_nakshatra = male_moon['nakshatra']
     female_nakshatra = female_moon['nakshatra']
-    male_moon_sign_idx = ZODIAC_SIGNS.index(male_moon['sign'])
-    female_moon_sign_idx = ZODIAC_SIGNS.index(female_moon['sign'])
+    male_moon_sign_idx = SIGN_TO_IDX[male_moon['sign']]
+    female_moon_sign_idx = SIGN_TO_IDX[female_moon['sign']]
 
     # Calculate all 8 aspects
     varna = _varna_score(male_nakshatra, female_nakshatra)
@@ -1,6 +1,10 @@
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
+from datetime import datetime
+
+from ..response import FastJSONResponse
+from ..utils import TimezoneName
 
 
 router = APIRouter()
@@ -78,42 +82,41 @@ SUB_PERIOD_MODIFIERS = {
 class DashaRequest(BaseModel):
     dateOfBirth: str = Field(..., example="1990-05-15")
     timeOfBirth: str = Field(..., example="14:30")
-    timezone: str = Field(..., example="Asia/Kolkata")
+    timezone: TimezoneName = Field(..., example="Asia/Kolkata")
     latitude: Optional[float] = Field(None, example=28.6139)
     longitude: Optional[float] = Field(None, example=77.2090)
     houseSystem: Optional[str] = Field(None, example='W')
 
 
-@router.post('/dasha/vimshottari')
+@router.post('/dasha/vimshottari', response_class=FastJSONResponse)
 def vimshottari(body: DashaRequest):
-    from ..main import to_julian, parse_local_datetime, vimshottari_full, calc_planets, calc_houses, sunrise_sunset
+    from ..main import (
+        to_julian, parse_local_datetime, vimshottari_full, vimshottari_validation, compute_chart, sunrise_sunset,
+        period_at, get_timezone,
+    )
     jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
     birth_local = parse_local_datetime(body.dateOfBirth, body.timeOfBirth, body.timezone)
     res = vimshottari_full(jd, birth_local)
-    from ..main import validate_vimshottari_schedule
-    validation = validate_vimshottari_schedule(res)
+    validation = vimshottari_validation(jd, birth_local)
 
     # Determine current MD/AD/PD at 'now' in the provided timezone
     current_now = None
     current_prediction = None
     try:
-        import pytz
-        from datetime import datetime
-        tz = pytz.timezone(body.timezone)
-        today = datetime.now(tz).date().isoformat()
-        cur_md = next((md for md in res.get('mahadashas', []) if md['startDate'] <= today < md['endDate']), None)
+        today = datetime.now(get_timezone(body.timezone)).date().isoformat()
+        cur_md = period_at(res.get('mahadashas', []), today)
         if cur_md:
-            cur_ad = next((ad for ad in cur_md.get('antardasha', []) if ad['startDate'] <= today < ad['endDate']), None)
+            cur_ad = period_at(cur_md.get('antardasha', []), today)
             cur_pd = None
             if cur_ad:
-                cur_pd = next((pd for pd in cur_ad.get('pratyantar', []) if pd['startDate'] <= today < pd['endDate']), None)
+                cur_pd = period_at(cur_ad.get('pratyantar', []), today)
         else:
             cur_ad, cur_pd = None, None
         if cur_md:
             cur_sook = None
             if cur_pd:
                 try:
-                    cur_sook = next((sd for sd in cur_pd.get('sookshma', []) if sd['startDate'] <= today < sd['endDate']), None)
+                    cur_sook = period_at(cur_pd.get('sookshma', []), today)
                 except Exception:
                     cur_sook = None
             current_now = {
@@ -148,9 +151,9 @@ def vimshottari(body: DashaRequest):
     context = {}
     if body.latitude is not None and body.longitude is not None:
         try:
-            planets = calc_planets(jd, None, 'mean')
             hs_code = body.houseSystem or 'W'
-            houses = calc_houses(jd, float(body.latitude), float(body.longitude), planets, hs_code)
+            _, _, houses = compute_chart(body.dateOfBirth, body.timeOfBirth, body.timezone,
+                                         float(body.latitude), float(body.longitude), 'mean', hs_code)
             sr, ss, sr_jd, ss_jd = sunrise_sunset(body.dateOfBirth, body.timezone, float(body.latitude), float(body.longitude))
             context = {
                 'ascendant': houses.get('ascendant'),
@@ -162,7 +165,7 @@ def vimshottari(body: DashaRequest):
         except Exception as e:
             context = {'warning': f'Location context unavailable: {e}'}
 
-    return {
+    return FastJSONResponse({
         'status': 200,
         'system': 'Vimshottari',
         'data': res,
@@ -170,4 +173,4 @@ def vimshottari(body: DashaRequest):
         'currentPrediction': current_prediction,
         'context': context,
         'validation': validation
-    }
+    })
@@ -1,6 +1,9 @@
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Any, List, Tuple
+
+from ..response import FastJSONResponse
+from ..utils import TimezoneName, Latitude, Longitude, HouseSystemCode, ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_ROTATIONS
 
 router = APIRouter()
 
@@ -8,36 +11,30 @@ router = APIRouter()
 class CharaDashaRequest(BaseModel):
     dateOfBirth: str = Field(..., example="1990-05-15")
     timeOfBirth: str = Field(..., example="14:30")
-    timezone: str = Field(..., example="Asia/Kolkata")
-    latitude: float = Field(..., example=28.6139)
-    longitude: float = Field(..., example=77.2090)
-    houseSystem: Optional[str] = Field(None, example='W')
-
+    timezone: TimezoneName = Field(..., example="Asia/Kolkata")
+    latitude: Latitude = Field(..., example=28.6139)
+    longitude: Longitude = Field(..., example=77.2090)
+    houseSystem: HouseSystemCode = Field('W', example='W')
 
-def _sign_index(sign: str) -> int:
-    from ..main import ZODIAC_SIGNS
-    return ZODIAC_SIGNS.index(sign)
+    # Requests are read-only once parsed
+    model_config = ConfigDict(frozen=True)
 
 
 def _sign_distance(start: str, end: str) -> int:
     # Inclusive distance in signs moving forward from start to reach end
-    from ..main import ZODIAC_SIGNS
-    si = _sign_index(start)
-    ei = _sign_index(end)
-    if ei >= si:
-        return (ei - si) + 1
-    return (12 - si) + ei + 1
+    return (SIGN_TO_IDX[end] - SIGN_TO_IDX[start]) % 12 + 1
+
+
+# Sequence starting from each sign and moving forward 12 signs, keyed by the starting sign's name
+CHARA_SEQUENCES: Dict[str, Tuple[str, ...]] = dict(zip(ZODIAC_SIGNS, SIGN_ROTATIONS))
 
 
-def _build_chara_sequence(lagna_sign: str) -> List[str]:
-    # Sequence starting from Lagna sign and moving forward 12 signs
-    from ..main import ZODIAC_SIGNS
-    si = _sign_index(lagna_sign)
-    return [ZODIAC_SIGNS[(si + i) % 12] for i in range(12)]
+def _build_chara_sequence(lagna_sign: str) -> Tuple[str, ...]:
+    return CHARA_SEQUENCES[lagna_sign]
 
 
-@router.post('/dasha/chara')
-def chara_dasha(body: CharaDashaRequest) -> Dict[str, Any]:
+@router.post('/dasha/chara', response_class=FastJSONResponse)
+def chara_dasha(body: CharaDashaRequest) -> FastJSONResponse:
     """
     Simplified Jaimini Chara Dasha implementation (sign-based):
     - Requires location to compute Lagna (ascendant)
@@ -46,106 +43,68 @@ def chara_dasha(body: CharaDashaRequest) -> Dict[str, Any]:
     - PD inside an AD: similarly proportional.
     Note: Schools vary (K.N. Rao, Sanjay Rath, etc.). This is a basic, consistent variant for productization.
     """
-    from ..main import (
-        to_julian, parse_local_datetime, calc_planets, calc_houses, SIGN_LORDS,
-    )
+    from ..main import parse_local_datetime, compute_chart, SIGN_LORDS, pd_years, period_at
 
-    jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
     birth_local = parse_local_datetime(body.dateOfBirth, body.timeOfBirth, body.timezone)
 
-    planets = calc_planets(jd, None, 'mean')
-    houses = calc_houses(jd, float(body.latitude), float(body.longitude), planets, body.houseSystem or 'W')
+    _, planets, houses = compute_chart(body.dateOfBirth, body.timeOfBirth, body.timezone,
+                                       body.latitude, body.longitude, 'mean', body.houseSystem)
     lagna_sign = houses['ascendant']['sign']
 
     seq = _build_chara_sequence(lagna_sign)
 
-    # Compute MD durations
-    md_list = []
-    cursor = birth_local
+    # A sign's span (distance to its lord's sign) is the same at every level, so work it out once per sign.
+    # In Jaimini, some use sign-based lords (same as Parasara); acceptable here
+    planet_signs = {p['name']: p['sign'] for p in planets}
+    lord_signs = {s: planet_signs.get(SIGN_LORDS[s], s) for s in seq}
+    sign_years = {s: _sign_distance(s, lord_signs[s]) for s in seq}
+    # Every AD sequence is a rotation of all 12 signs, so the parts always sum to the same total
+    total_part = sum(sign_years.values())
+
+    def to_date(d):
+        return d.date().isoformat()
+
+    # Build MD/AD/PD straight into their serialized form. Every boundary is the birth moment plus a whole
+    # number of days, so each is formatted once and reused as the next period's start.
+    mahadashas = []
+    md_start, md_start_date = birth_local, to_date(birth_local)
     for sign in seq:
-        lord = SIGN_LORDS[sign]
-        # In Jaimini, some use sign-based lords (same as Parasara); acceptable here
-        lord_planet = next((p for p in planets if p['name'] == lord), None)
-        lord_sign = lord_planet['sign'] if lord_planet else sign
-        years = _sign_distance(sign, lord_sign)
-        md_start = cursor
-        md_list.append({'sign': sign, 'lord': lord, 'lordSign': lord_sign, 'years': years, 'start': md_start, 'end': None})
-
-    # Assign MD start/end cumulatively
-    cursor = birth_local
-    for md in md_list:
-        from ..main import pd_years
-        md['start'] = cursor
-        md_end = cursor + pd_years(md['years'])
-        md['end'] = md_end
-        cursor = md_end
-
-    # Build AD and PD
-    def build_ad(md_sign: str, md_start, md_years: float):
-        ad = []
-        sub_seq = _build_chara_sequence(md_sign)
-        from ..main import pd_years, SIGN_LORDS
-        cursor_a = md_start
-        # Precompute parts and normalize to md_years
-        parts = []
-        for s in sub_seq:
-            lord = SIGN_LORDS[s]
-            lord_planet = next((p for p in planets if p['name'] == lord), None)
-            lord_sign = lord_planet['sign'] if lord_planet else s
-            parts.append((_sign_distance(s, lord_sign), s))
-        total_part = sum(p for p, _ in parts)
-        for s in sub_seq:
-            lord = SIGN_LORDS[s]
-            lord_planet = next((p for p in planets if p['name'] == lord), None)
-            lord_sign = lord_planet['sign'] if lord_planet else s
-            part = _sign_distance(s, lord_sign)
+        md_years = sign_years[sign]
+        md_end = md_start + pd_years(md_years)
+        antardasha = []
+        ad_start, ad_start_date = md_start, md_start_date
+        for s in CHARA_SEQUENCES[sign]:
+            part = sign_years[s]
             # proportional split normalized across sequence
             ad_years = md_years * (part / total_part) if total_part > 0 else (md_years / 12.0)
-            ad_start = cursor_a
             ad_end = ad_start + pd_years(ad_years)
-            ad.append({'sign': s, 'years': ad_years, 'start': ad_start, 'end': ad_end, 'pratyantar': []})
-            cursor_a = ad_end
-        return ad
-
-    for md in md_list:
-        md['antardasha'] = build_ad(md['sign'], md['start'], md['years'])
-        # Build PD within each AD: simple equal split across 12 signs
-        for ad in md['antardasha']:
-            from ..main import pd_years
-            cursor_p = ad['start']
-            pd_dur = (ad['years'] / 12.0)
-            pd_list = []
-            for s in _build_chara_sequence(ad['sign']):
-                p_start = cursor_p
-                p_end = p_start + pd_years(pd_dur)
-                pd_list.append({'sign': s, 'years': pd_dur, 'start': p_start, 'end': p_end})
-                cursor_p = p_end
-            ad['pratyantar'] = pd_list
-
-    # Identify current MD/AD/PD by birth date (start of the sequence)
-    def to_date(d):
-        return d.date().isoformat()
-
-    now = birth_local
-    current_md = next((m for m in md_list if m['start'] <= now < m['end']), md_list[0])
-    current_ad = next((a for a in current_md['antardasha'] if a['start'] <= now < a['end']), current_md['antardasha'][0])
-    current_pd = next((p for p in current_ad['pratyantar'] if p['start'] <= now < p['end']), current_ad['pratyantar'][0])
-
-    # Serialize
-    def ser_md(m):
-        return {
-            'sign': m['sign'], 'lord': m['lord'], 'lordSign': m['lordSign'], 'startDate': to_date(m['start']), 'endDate': to_date(m['end']), 'years': m['years'],
-            'antardasha': [
-                {
-                    'sign': a['sign'], 'startDate': to_date(a['start']), 'endDate': to_date(a['end']), 'years': a['years'],
-                    'pratyantar': [
-                        {'sign': p['sign'], 'startDate': to_date(p['start']), 'endDate': to_date(p['end']), 'years': p['years']}
-                        for p in a['pratyantar']
-                    ]
-                }
-                for a in m['antardasha']
-            ]
-        }
+            # Build PD within each AD: simple equal split across 12 signs
+            pd_dur = (ad_years / 12.0)
+            pd_delta = pd_years(pd_dur)
+            pratyantar = []
+            # PD steps are whole days, so walk them on the plain date and skip the per-step .date() call
+            p_day, p_start_date = ad_start.date(), ad_start_date
+            for ps in CHARA_SEQUENCES[s]:
+                p_day += pd_delta
+                p_end_date = p_day.isoformat()
+                pratyantar.append({'sign': ps, 'startDate': p_start_date, 'endDate': p_end_date, 'years': pd_dur})
+                p_start_date = p_end_date
+            ad_end_date = to_date(ad_end)
+            antardasha.append({'sign': s, 'startDate': ad_start_date, 'endDate': ad_end_date, 'years': ad_years,
+                               'pratyantar': pratyantar})
+            ad_start, ad_start_date = ad_end, ad_end_date
+        md_end_date = to_date(md_end)
+        mahadashas.append({'sign': sign, 'lord': SIGN_LORDS[sign], 'lordSign': lord_signs[sign],
+                           'startDate': md_start_date, 'endDate': md_end_date, 'years': md_years,
+                           'antardasha': antardasha})
+        md_start, md_start_date = md_end, md_end_date
+
+    # Identify current MD/AD/PD by birth date (start of the sequence). Boundaries share the birth time of day,
+    # so comparing ISO dates orders them exactly as comparing the datetimes would.
+    now = to_date(birth_local)
+    current_md = period_at(mahadashas, now) or mahadashas[0]
+    current_ad = period_at(current_md['antardasha'], now) or current_md['antardasha'][0]
+    current_pd = period_at(current_ad['pratyantar'], now) or current_ad['pratyantar'][0]
 
     # Validation helpers
     def days_between(a: str, b: str) -> int:
@@ -189,20 +148,20 @@ def chara_dasha(body: CharaDashaRequest) -> Dict[str, Any]:
 
     schedule = {
         'current': {
-            'mahadasha': {'sign': current_md['sign'], 'startDate': to_date(current_md['start']), 'endDate': to_date(current_md['end'])},
-            'antardasha': {'sign': current_ad['sign'], 'startDate': to_date(current_ad['start']), 'endDate': to_date(current_ad['end'])},
-            'pratyantar': {'sign': current_pd['sign'], 'startDate': to_date(current_pd['start']), 'endDate': to_date(current_pd['end'])},
+            'mahadasha': {'sign': current_md['sign'], 'startDate': current_md['startDate'], 'endDate': current_md['endDate']},
+            'antardasha': {'sign': current_ad['sign'], 'startDate': current_ad['startDate'], 'endDate': current_ad['endDate']},
+            'pratyantar': {'sign': current_pd['sign'], 'startDate': current_pd['startDate'], 'endDate': current_pd['endDate']},
         },
-        'mahadashas': [ser_md(m) for m in md_list]
+        'mahadashas': mahadashas
     }
 
-    return {
+    return FastJSONResponse({
         'status': 200,
         'system': 'Chara Dasha (Jaimini)',
         'data': schedule,
         'validation': validate(schedule),
         'context': {
             'ascendant': houses.get('ascendant'),
-            'houseSystem': (body.houseSystem or 'W')
+            'houseSystem': body.houseSystem
         }
-    }
+    })
@@ -8,7 +8,7 @@ from dateutil import parser
 from ..utils import (
     to_julian, calc_planets, calc_houses, get_sign, get_nakshatra,
     ZODIAC_SIGNS, SIGN_LORDS, PLANET_PROPS, DASHA_YEARS, DASHA_SEQUENCE,
-    planet_status, NAKSHATRAS,
+    planet_status, NAKSHATRAS, get_timezone,
 )
 
 router = APIRouter()
@@ -296,8 +296,7 @@ def dasha_timeline(body: DashaDetailRequest) -> Dict[str, Any]:
 
     data = _compute_vimshottari_full(jd, birth_dt_local)
 
-    tz = pytz.timezone(body.timezone)
-    today_str = datetime.now(tz).date().isoformat()
+    today_str = datetime.now(get_timezone(body.timezone)).date().isoformat()
 
     planets = _calc_planets(jd, None, body.nodeMode or 'mean')
     houses_data = _calc_houses(jd, body.latitude, body.longitude, planets, 'W')
@@ -423,8 +422,7 @@ def dasha_planet_details(body: DashaPlanetRequest) -> Dict[str, Any]:
 
     data = _compute_vimshottari_full(jd, birth_dt_local)
 
-    tz = pytz.timezone(body.timezone)
-    today_str = datetime.now(tz).date().isoformat()
+    today_str = datetime.now(get_timezone(body.timezone)).date().isoformat()
 
     planets = _calc_planets(jd, None, body.nodeMode or 'mean')
     houses_data = _calc_houses(jd, body.latitude, body.longitude, planets, 'W')
@@ -557,8 +555,7 @@ def current_dasha(body: DashaDetailRequest) -> Dict[str, Any]:
 
     data = _compute_vimshottari_full(jd, birth_dt_local)
 
-    tz = pytz.timezone(body.timezone)
-    today_str = datetime.now(tz).date().isoformat()
+    today_str = datetime.now(get_timezone(body.timezone)).date().isoformat()
 
     planets = _calc_planets(jd, None, body.nodeMode or 'mean')
     houses_data = _calc_houses(jd, body.latitude, body.longitude, planets, 'W')
@@ -159,7 +159,7 @@ KALACHAKRA_YEARS = {
 
 @router.post('/dasha/kalachakra')
 def kalachakra_dasha(body: BirthRequest):
-    from ..main import to_julian, calc_planets, ZODIAC_SIGNS, SIGN_LORDS, get_nakshatra, NAKSHATRAS
+    from ..main import to_julian, calc_planets, ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS, get_nakshatra, NAKSHATRAS
     import pytz
     from datetime import datetime
 
@@ -171,7 +171,7 @@ def kalachakra_dasha(body: BirthRequest):
 
     moon_lon = moon['longitude']
     moon_sign = moon['sign']
-    moon_sign_idx = ZODIAC_SIGNS.index(moon_sign)
+    moon_sign_idx = SIGN_TO_IDX[moon_sign]
     nk_idx = int(moon_lon // 13.333333) % 27
     pada = int(((moon_lon % 13.333333) / 13.333333) * 4) + 1
 
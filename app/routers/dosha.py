@@ -1,6 +1,9 @@
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..cache import cache_key
+from ..response import FastJSONResponse, cached_json
+from ..utils import TimezoneName, Latitude, Longitude, HouseSystemCode, NodeModeName
 
 
 router = APIRouter()
@@ -9,23 +12,30 @@ router = APIRouter()
 class DoshaRequest(BaseModel):
     dateOfBirth: str = Field(..., example="1990-05-15")
     timeOfBirth: str = Field(..., example="14:30")
-    latitude: float = Field(..., example=28.6139)
-    longitude: float = Field(..., example=77.2090)
-    timezone: str = Field(..., example="Asia/Kolkata")
-    houseSystem: Optional[str] = Field('W', example='W')
-    nodeMode: Optional[str] = Field('mean', example='mean')
+    latitude: Latitude = Field(..., example=28.6139)
+    longitude: Longitude = Field(..., example=77.2090)
+    timezone: TimezoneName = Field(..., example="Asia/Kolkata")
+    houseSystem: HouseSystemCode = Field('W', example='W')
+    nodeMode: NodeModeName = Field('mean', example='mean')
+
+    # Requests are read-only once parsed
+    model_config = ConfigDict(frozen=True)
 
 
-@router.post('/dosha/compute')
+@router.post('/dosha/compute', response_class=FastJSONResponse)
 def compute_dosha(body: DoshaRequest):
     # Import locally to avoid circular imports
-    from ..main import to_julian, calc_planets, calc_houses, detect_doshas
-    jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
-    planets = calc_planets(jd, None, body.nodeMode or 'mean')
-    # Ensure houses are set so Mangal dosha etc can be evaluated
-    calc_houses(jd, body.latitude, body.longitude, planets, body.houseSystem or 'W')
-    doshas = detect_doshas(planets)
-    return {
-        'status': 200,
-        'data': doshas
-    }
+    from ..main import compute_chart, detect_doshas
+
+    def build():
+        # Planets come back with houses set, so Mangal dosha etc can be evaluated
+        _, planets, _ = compute_chart(body.dateOfBirth, body.timeOfBirth, body.timezone,
+                                      body.latitude, body.longitude, body.nodeMode, body.houseSystem)
+        doshas = detect_doshas(planets)
+        return {
+            'status': 200,
+            'data': doshas
+        }
+
+    # Doshas depend only on the birth details, so the key is a hash of the full request
+    return cached_json(cache_key("dosha", body.model_dump_json()), build)
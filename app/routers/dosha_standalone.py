@@ -111,10 +111,11 @@ def grahan_dosha(body: DoshaStandaloneRequest) -> Dict[str, Any]:
 
     planets = _get_planets_for(body)
 
-    sun = next((p for p in planets if p['name'] == 'Sun'), None)
-    moon = next((p for p in planets if p['name'] == 'Moon'), None)
-    rahu = next((p for p in planets if p['name'] == 'Rahu'), None)
-    ketu = next((p for p in planets if p['name'] == 'Ketu'), None)
+    pmap = {p['name']: p for p in planets}
+    sun = pmap.get('Sun')
+    moon = pmap.get('Moon')
+    rahu = pmap.get('Rahu')
+    ketu = pmap.get('Ketu')
 
     afflictions = []
 
@@ -194,8 +195,9 @@ def shrapit_dosha(body: DoshaStandaloneRequest) -> Dict[str, Any]:
 
     planets = _get_planets_for(body)
 
-    saturn = next((p for p in planets if p['name'] == 'Saturn'), None)
-    rahu = next((p for p in planets if p['name'] == 'Rahu'), None)
+    pmap = {p['name']: p for p in planets}
+    saturn = pmap.get('Saturn')
+    rahu = pmap.get('Rahu')
 
     shrapit_present = False
     details = {}
@@ -402,7 +404,7 @@ def nadi_dosha(body: NadiDoshaRequest) -> Dict[str, Any]:
 
 @router.post('/dosha/bhakoot-dosha')
 def bhakoot_dosha(body: NadiDoshaRequest) -> Dict[str, Any]:
-    from ..main import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_LORDS, get_nakshatra
+    from ..main import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS, get_nakshatra
 
     jd_male = to_julian(body.maleDateOfBirth, body.maleTimeOfBirth, body.maleTimezone)
     planets_male = calc_planets(jd_male, None, body.nodeMode or 'mean')
@@ -415,8 +417,8 @@ def bhakoot_dosha(body: NadiDoshaRequest) -> Dict[str, Any]:
     if not male_moon or not female_moon:
         return {'status': 400, 'error': 'Could not compute Moon positions'}
 
-    male_sign_idx = ZODIAC_SIGNS.index(male_moon['sign'])
-    female_sign_idx = ZODIAC_SIGNS.index(female_moon['sign'])
+    male_sign_idx = SIGN_TO_IDX[male_moon['sign']]
+    female_sign_idx = SIGN_TO_IDX[female_moon['sign']]
     diff = (female_sign_idx - male_sign_idx) % 12 + 1
 
     bhakoot_dosha_present = diff in [2, 12, 1, 5, 6]
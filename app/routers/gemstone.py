@@ -290,10 +290,9 @@ def _get_ascendant_lord(planets, houses):
 
 def _get_current_dasha_lord(timezone):
     try:
-        import pytz
         from datetime import datetime
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
+        from ..main import get_timezone
+        now = datetime.now(get_timezone(timezone))
         return now
     except Exception:
         return None
@@ -365,10 +364,9 @@ def gemstone_recommendation(body: BirthDetailRequest):
     asc_lord = _get_ascendant_lord(planets, houses)
     current_md_lord = None
     try:
-        import pytz
         from datetime import datetime
-        tz = pytz.timezone(body.timezone)
-        today = datetime.now(tz).date().isoformat()
+        from ..main import get_timezone
+        today = datetime.now(get_timezone(body.timezone)).date().isoformat()
         for md in dasha.get('mahadashas', []):
             if md['startDate'] <= today < md['endDate']:
                 current_md_lord = md['planet']
@@ -430,10 +428,9 @@ def gemstone_by_dasha(body: BirthDetailRequest):
     jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
     birth_local = parse_local_datetime(body.dateOfBirth, body.timeOfBirth, body.timezone)
     dasha = vimshottari_full(jd, birth_local)
-    import pytz
     from datetime import datetime
-    tz = pytz.timezone(body.timezone)
-    today = datetime.now(tz).date().isoformat()
+    from ..main import get_timezone
+    today = datetime.now(get_timezone(body.timezone)).date().isoformat()
     current_md_lord = None
     current_ad_lord = None
     for md in dasha.get('mahadashas', []):
@@ -471,10 +468,9 @@ def gemstone_wearing(body: BirthDetailRequest):
     asc_lord = _get_ascendant_lord(planets, houses)
     current_md_lord = None
     try:
-        import pytz
         from datetime import datetime
-        tz = pytz.timezone(body.timezone)
-        today = datetime.now(tz).date().isoformat()
+        from ..main import get_timezone
+        today = datetime.now(get_timezone(body.timezone)).date().isoformat()
         for md in dasha.get('mahadashas', []):
             if md['startDate'] <= today < md['endDate']:
                 current_md_lord = md['planet']
@@ -83,9 +83,10 @@ def kp_planet_details(body: BirthRequest):
 
     house_list = houses.get('houses', [])
     ordered = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+    pmap = {pl['name']: pl for pl in planets}
     planet_details = []
     for pname in ordered:
-        p = next((pl for pl in planets if pl['name'] == pname), None)
+        p = pmap.get(pname)
         if not p:
             continue
         ph = p.get('house', 0)
@@ -425,9 +426,10 @@ def kp_star_lords(body: BirthRequest):
     planets = calc_planets(jd, None, body.nodeMode or 'mean')
 
     ordered = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+    pmap = {pl['name']: pl for pl in planets}
     result = []
     for pname in ordered:
-        p = next((pl for pl in planets if pl['name'] == pname), None)
+        p = pmap.get(pname)
         if not p:
             continue
         star_lord = _get_star_lord(p['longitude'])
@@ -211,7 +211,7 @@ def lal_kitab_planet_interpretations():
 
 @router.post('/lal-kitab/chart-analysis')
 def lal_kitab_chart_analysis(body: BirthRequest):
-    from ..main import to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_LORDS
+    from ..main import to_julian, calc_planets, calc_houses, SIGN_TO_IDX, SIGN_LORDS
     from datetime import datetime
     import pytz
 
@@ -221,13 +221,14 @@ def lal_kitab_chart_analysis(body: BirthRequest):
 
     house_list = houses.get('houses', [])
     asc_sign = houses.get('ascendant', {}).get('sign', 'Aries')
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
 
     ordered = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+    pmap = {pl['name']: pl for pl in planets}
     planet_analyses = []
 
     for pname in ordered:
-        p = next((pl for pl in planets if pl['name'] == pname), None)
+        p = pmap.get(pname)
         if not p:
             continue
         ph = p.get('house', 0)
@@ -247,7 +248,7 @@ def lal_kitab_chart_analysis(body: BirthRequest):
         planets_in_house = h.get('planets', [])
         hp_analyses = []
         for pname in planets_in_house:
-            p = next((pl for pl in planets if pl['name'] == pname), None)
+            p = pmap.get(pname)
             if p:
                 st = 'Retrograde' if p.get('isRetrograde') else 'Direct'
                 hp_analyses.append({'planet': pname, 'status': st, 'degree': round(p.get('degree', 0), 2)})
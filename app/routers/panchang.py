@@ -1,5 +1,9 @@
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..cache import cache_key
+from ..response import FastJSONResponse, cached_json
+from ..utils import TimezoneName, Latitude, Longitude
 
 router = APIRouter()
 
@@ -7,17 +11,25 @@ router = APIRouter()
 class PanchangRequest(BaseModel):
     dateOfBirth: str = Field(..., example="1990-05-15")
     timeOfBirth: str = Field(..., example="14:30")
-    latitude: float = Field(..., example=28.6139)
-    longitude: float = Field(..., example=77.2090)
-    timezone: str = Field(..., example="Asia/Kolkata")
+    latitude: Latitude = Field(..., example=28.6139)
+    longitude: Longitude = Field(..., example=77.2090)
+    timezone: TimezoneName = Field(..., example="Asia/Kolkata")
+
+    # Requests are read-only once parsed
+    model_config = ConfigDict(frozen=True)
 
 
-@router.post('/panchang')
+@router.post('/panchang', response_class=FastJSONResponse)
 def compute(body: PanchangRequest):
     # Import lazily to avoid circular dependencies
     from ..main import compute_panchang
-    data = compute_panchang(body.dateOfBirth, body.timeOfBirth, body.timezone, body.latitude, body.longitude)
-    return {
-        'status': 200,
-        'data': data
-    }
+
+    def build():
+        data = compute_panchang(body.dateOfBirth, body.timeOfBirth, body.timezone, body.latitude, body.longitude)
+        return {
+            'status': 200,
+            'data': data
+        }
+
+    # Panchang for a birth moment is fixed, so the key is a hash of the full request
+    return cached_json(cache_key("panchang", body.model_dump_json()), build)
@@ -29,10 +29,10 @@ def _get_chart(body):
     jd = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
     planets = calc_planets(jd, None, "mean")
     house_data = calc_houses(jd, body.latitude, body.longitude, planets, "W")
-    moon_sign = next((p['sign'] for p in planets if p['name'] == 'Moon'), 'Aries')
-    sun_sign = next((p['sign'] for p in planets if p['name'] == 'Sun'), 'Aries')
-    asc_sign = house_data['ascendant']['sign']
     pmap = {p['name']: p for p in planets}
+    moon_sign = pmap['Moon']['sign'] if 'Moon' in pmap else 'Aries'
+    sun_sign = pmap['Sun']['sign'] if 'Sun' in pmap else 'Aries'
+    asc_sign = house_data['ascendant']['sign']
     house_map = {h['number']: h for h in house_data['houses']}
     return jd, planets, house_data, moon_sign, sun_sign, asc_sign, pmap, house_map
 
@@ -89,14 +89,14 @@ def _transit_prediction(planet: str, transit_house: int, natal_house: int) -> st
 
 @router.post('/transit')
 def compute_transit(body: TransitRequest) -> Dict[str, Any]:
-    from ..main import (to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_LORDS,
+    from ..main import (to_julian, calc_planets, calc_houses, ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS,
                         get_nakshatra, to_dms)
 
     jd_birth = to_julian(body.dateOfBirth, body.timeOfBirth, body.timezone)
     planets_birth = calc_planets(jd_birth, None, body.nodeMode or 'mean')
     house_data_birth = calc_houses(jd_birth, body.latitude, body.longitude, planets_birth, body.houseSystem or 'W')
     asc_sign = house_data_birth['ascendant']['sign']
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
 
     # Transit date
     tz = pytz.timezone(body.timezone)
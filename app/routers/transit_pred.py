@@ -8,7 +8,7 @@ from dateutil import parser
 
 from ..utils import (
     to_julian, calc_planets, calc_houses, get_sign, get_nakshatra,
-    ZODIAC_SIGNS, SIGN_LORDS, PLANET_PROPS, planet_status, ayanamsa_value,
+    ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS, PLANET_PROPS, planet_status, ayanamsa_value,
 )
 
 router = APIRouter()
@@ -316,8 +316,8 @@ def _get_special_aspects(planet: str, transit_lon: float, natal_planets: List[Di
 
 
 def _get_transit_house(transit_sign: str, asc_sign: str) -> int:
-    transit_idx = ZODIAC_SIGNS.index(transit_sign)
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    transit_idx = SIGN_TO_IDX[transit_sign]
+    asc_idx = SIGN_TO_IDX[asc_sign]
     return ((transit_idx - asc_idx + 12) % 12) + 1
 
 
@@ -518,11 +518,11 @@ def transit_by_planet(body: TransitByPlanetRequest) -> Dict[str, Any]:
     if planet_name in ['Jupiter', 'Saturn', 'Rahu', 'Ketu', 'Mars']:
         current_lon = target_transit['longitude']
         current_sign = target_transit['sign']
-        current_sign_idx = ZODIAC_SIGNS.index(current_sign)
+        current_sign_idx = SIGN_TO_IDX[current_sign]
         next_signs = []
         for i in range(1, 4):
             next_idx = (current_sign_idx + i) % 12
-            next_house = ((next_idx - ZODIAC_SIGNS.index(asc_sign) + 12) % 12) + 1
+            next_house = ((next_idx - SIGN_TO_IDX[asc_sign] + 12) % 12) + 1
             next_effect = _get_planet_effect(planet_name, next_house, False)
             next_signs.append({
                 'sign': ZODIAC_SIGNS[next_idx],
@@ -631,8 +631,8 @@ def transit_timing(body: TransitTimingRequest) -> Dict[str, Any]:
         })
 
         if not is_triggering:
-            transit_sign_idx = ZODIAC_SIGNS.index(tp['sign'])
-            asc_idx = ZODIAC_SIGNS.index(asc_sign)
+            transit_sign_idx = SIGN_TO_IDX[tp['sign']]
+            asc_idx = SIGN_TO_IDX[asc_sign]
             houses_to_trigger = []
 
             for th in target_houses:
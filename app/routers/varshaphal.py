@@ -8,7 +8,7 @@ from dateutil import parser
 
 from ..utils import (
     to_julian, calc_planets, calc_houses, get_sign, get_nakshatra,
-    ZODIAC_SIGNS, SIGN_LORDS, PLANET_PROPS, planet_status, sunrise_sunset,
+    ZODIAC_SIGNS, SIGN_TO_IDX, SIGN_LORDS, PLANET_PROPS, planet_status, sunrise_sunset,
     ayanamsa_value,
 )
 
@@ -120,7 +120,7 @@ def _find_solar_return_jd(
 
 def _calc_muntha(asc_sign: str, age_at_return: int) -> Dict[str, Any]:
     """Muntha: the house progressed from the natal ascendant (1 sign per year)."""
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
     muntha_idx = (asc_idx + age_at_return) % 12
     muntha_sign = ZODIAC_SIGNS[muntha_idx]
     muntha_house = ((muntha_idx - asc_idx + 12) % 12) + 1
@@ -135,7 +135,7 @@ def _calc_muntha(asc_sign: str, age_at_return: int) -> Dict[str, Any]:
 def _detect_yogas(planets: list, asc_sign: str) -> list:
     res = []
     pmap = {p['name']: p for p in planets}
-    asc_idx = ZODIAC_SIGNS.index(asc_sign)
+    asc_idx = SIGN_TO_IDX[asc_sign]
 
     def in_kendra(p):
         return p.get('house', 0) in [1, 4, 7, 10]
@@ -1,15 +1,33 @@
 """Shared utilities extracted from main.py to break circular imports."""
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Annotated, Optional, Dict, Any, List, Tuple
+from datetime import datetime, timezone
+from functools import lru_cache
+from bisect import bisect_right
+from zoneinfo import ZoneInfo
 import swisseph as swe
-import pytz
 from dateutil import parser
+from pydantic import BeforeValidator, Field, StringConstraints
 import logging
+import threading
 
-ZODIAC_SIGNS = [
+# Swiss Ephemeris keeps its configuration in thread-local storage, so the
+# sidereal mode has to be set once per worker thread rather than once per process.
+_swe_thread = threading.local()
+
+
+def ensure_sidereal_mode() -> None:
+    if not getattr(_swe_thread, 'lahiri', False):
+        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+        _swe_thread.lahiri = True
+
+
+ZODIAC_SIGNS = (
     'Aries','Taurus','Gemini','Cancer','Leo','Virgo',
     'Libra','Scorpio','Sagittarius','Capricorn','Aquarius','Pisces'
-]
+)
+SIGN_TO_IDX: Dict[str, int] = {s: i for i, s in enumerate(ZODIAC_SIGNS)}
+# SIGN_ROTATIONS[i] lists the twelve signs starting from sign i (house order from a lagna at i)
+SIGN_ROTATIONS = tuple(ZODIAC_SIGNS[i:] + ZODIAC_SIGNS[:i] for i in range(12))
 
 SIGN_LORDS = {
     'Aries': 'Mars','Taurus': 'Venus','Gemini': 'Mercury','Cancer': 'Moon',
@@ -29,6 +47,10 @@ NAKSHATRAS = [
     ('Purva Bhadrapada','Jupiter',320,333.333333),('Uttara Bhadrapada','Saturn',333.333333,346.666667),('Revati','Mercury',346.666667,360)
 ]
 
+NAK_WIDTH = 360.0 / 27.0
+NAK_NAMES = tuple(n[0] for n in NAKSHATRAS)
+NAK_LORDS = tuple(n[1] for n in NAKSHATRAS)
+
 PLANET_IDS = {
     'Sun': swe.SUN, 'Moon': swe.MOON, 'Mercury': swe.MERCURY,
     'Venus': swe.VENUS, 'Mars': swe.MARS, 'Jupiter': swe.JUPITER,
@@ -37,6 +59,8 @@ PLANET_IDS = {
 }
 
 COMBUSTION_DIST = {'Moon':12,'Mars':17,'Mercury':14,'Jupiter':11,'Venus':10,'Saturn':15}
+COMBUST_EXEMPT = frozenset({'Sun', 'Rahu', 'Ketu', 'Uranus', 'Neptune', 'Pluto'})
+RETRO_EXEMPT = frozenset({'Sun', 'Moon'})
 
 PLANET_PROPS = {
     'Sun':     {'exalted':'Aries','exDeg':10,'debil':'Libra','debilDeg':10,'own':['Leo'],'mool':'Leo','friends':['Moon','Mars','Jupiter'],'enemies':['Venus','Saturn'],'neutral':['Mercury']},
@@ -62,14 +86,52 @@ YOGA_NAMES = [
 KARANA_SEQUENCE = ['Bava','Balava','Kaulava','Taitila','Garaja','Vanija','Vishti','Shakuni','Chatushpada','Naga','Kimstughna']
 
 
+@lru_cache(maxsize=512)
+def get_timezone(tz_name: str) -> ZoneInfo:
+    return ZoneInfo(tz_name)
+
+
+# IANA zone names are at most ~32 characters; the bound is checked in pydantic-core, so oversized
+# values are rejected before they reach the zone lookup (or its cache).
+TimezoneName = Annotated[str, StringConstraints(strip_whitespace=True, max_length=64)]
+# Geographic bounds, likewise checked in pydantic-core before any ephemeris call.
+Latitude = Annotated[float, Field(ge=-90, le=90)]
+Longitude = Annotated[float, Field(ge=-180, le=180)]
+# Optional settings that fall back to the default when sent as null or '', so handlers never see None.
+HouseSystemCode = Annotated[str, BeforeValidator(lambda v: v or 'W')]
+NodeModeName = Annotated[str, BeforeValidator(lambda v: v or 'mean')]
+
+
+def localize(dt: datetime, tz_name: str) -> datetime:
+    """Attach a zone to a naive datetime.
+
+    DST gaps and overlaps resolve to standard time, matching the
+    ``pytz.localize(is_dst=False)`` behaviour this replaced.
+    """
+    local = dt.replace(tzinfo=get_timezone(tz_name), fold=1)
+    if local.dst():
+        local = local.replace(fold=0)
+    return local
+
+
+def parse_local(date_str: str, time_str: str, tz_name: str) -> datetime:
+    try:
+        dt = datetime.fromisoformat(f"{date_str}T{time_str}")
+    except ValueError:
+        dt = parser.parse(f"{date_str} {time_str}")
+    return localize(dt, tz_name)
+
+
+@lru_cache(maxsize=16384)
+def julday(year: int, month: int, day: int, hour: float) -> float:
+    return swe.julday(year, month, day, hour)
+
+
 def to_julian(date_str: str, time_str: str, tz_name: str) -> float:
-    dt_local = parser.parse(f"{date_str} {time_str}")
-    tz = pytz.timezone(tz_name)
-    dt_local = tz.localize(dt_local)
-    dt_utc = dt_local.astimezone(pytz.utc)
+    dt_utc = parse_local(date_str, time_str, tz_name).astimezone(timezone.utc)
     year, month, day = dt_utc.year, dt_utc.month, dt_utc.day
     hour = dt_utc.hour + dt_utc.minute / 60
-    return swe.julday(year, month, day, hour)
+    return julday(year, month, day, hour)
 
 
 def get_sign(lon: float) -> str:
@@ -77,40 +139,51 @@ def get_sign(lon: float) -> str:
 
 
 def get_nakshatra(lon: float):
-    for name, lord, start, end in NAKSHATRAS:
-        if start <= lon < end:
-            span = end - start
-            pos = lon - start
-            pada = int((pos / span) * 4) + 1
-            return {'name': name, 'lord': lord, 'pada': pada}
-    return {'name': 'Unknown', 'lord': 'Unknown', 'pada': 1}
+    # Nakshatras are equal 13°20' arcs, so the index is a single division rather than a table scan.
+    lon = lon % 360.0
+    idx = int(lon / NAK_WIDTH) % 27
+    pada = min(4, int((lon - idx * NAK_WIDTH) * 4 / NAK_WIDTH) + 1)
+    return {'name': NAK_NAMES[idx], 'lord': NAK_LORDS[idx], 'pada': pada, 'number': idx + 1}
 
 
+@lru_cache(maxsize=8192)
 def ayanamsa_value(jd: float) -> float:
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    ensure_sidereal_mode()
     return swe.get_ayanamsa(jd)
 
 
 def to_dms(x: float) -> str:
-    s = -1 if x < 0 else 1
-    x = abs(x)
+    neg = x < 0
+    if neg:
+        x = -x
     d = int(x)
-    m = int((x - d) * 60)
-    sec = int(round(((x - d) * 60 - m) * 60))
-    sign = '-' if s < 0 else ''
-    return f"{sign}{d}°{m}′{sec}″"
+    rem = (x - d) * 60
+    m = int(rem)
+    sec = int(round((rem - m) * 60))
+    # Rounding can push seconds (and then minutes) to 60; carry into the next unit.
+    if sec == 60:
+        sec = 0
+        m += 1
+        if m == 60:
+            m = 0
+            d += 1
+    return f"{'-' if neg else ''}{d}°{m}′{sec}″"
+
+
+_AVASTHA_ODD = ('Infant (Bala)', 'Young (Kumara)', 'Youth (Yuva)', 'Old (Vriddha)', 'Dead (Mrita)')
+_AVASTHA_EVEN = _AVASTHA_ODD[::-1]
+# Short Baladi avastha names used by compact chart payloads
+AVASTHA_COMPACT = dict(zip(_AVASTHA_ODD, ('Bala', 'Kumara', 'Yuva', 'Vriddha', 'Mritya')))
+_ODD_SIGNS = frozenset({'Aries', 'Gemini', 'Leo', 'Libra', 'Sagittarius', 'Aquarius'})
 
 
 def get_avastha(deg_in_sign: float, sign: str) -> str:
     idx = max(0, min(4, int(deg_in_sign // 6)))
-    odd = sign in ['Aries', 'Gemini', 'Leo', 'Libra', 'Sagittarius', 'Aquarius']
-    odd_order = ['Infant (Bala)', 'Young (Kumara)', 'Youth (Yuva)', 'Old (Vriddha)', 'Dead (Mrita)']
-    even_order = list(reversed(odd_order))
-    return (odd_order if odd else even_order)[idx]
+    return (_AVASTHA_ODD if sign in _ODD_SIGNS else _AVASTHA_EVEN)[idx]
 
 
 def is_combust(name: str, lon: float, sun_lon: float, retro: bool) -> bool:
-    if name in ['Sun', 'Rahu', 'Ketu', 'Uranus', 'Neptune', 'Pluto']:
+    if name in COMBUST_EXEMPT:
         return False
     dist = abs(lon - sun_lon)
     dist = min(dist, 360 - dist)
@@ -125,27 +198,34 @@ def is_combust(name: str, lon: float, sun_lon: float, retro: bool) -> bool:
 
 
 def calc_planets(jd: float, profile: Optional[str], node_mode: str, tropical: bool = False):
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    # Callers annotate the planet dicts (house, houseStatus), so hand out fresh copies of the cached rows.
+    return [dict(p) for p in _calc_planets_cached(jd, profile, node_mode, tropical)]
+
+
+@lru_cache(maxsize=2048)
+def _calc_planets_cached(jd: float, profile: Optional[str], node_mode: str, tropical: bool) -> tuple:
+    ensure_sidereal_mode()
     flags = swe.FLG_SWIEPH | swe.FLG_SPEED
     if not tropical:
         flags |= swe.FLG_SIDEREAL
+    # Pull every position out of Swiss Ephemeris first, then derive the
+    # per-planet attributes in one pass once the Sun's longitude is known.
+    node_id = swe.TRUE_NODE if node_mode == 'true' else swe.MEAN_NODE
+    ids = {**PLANET_IDS, 'Rahu': node_id, 'Ketu': node_id}
+    rows = []
+    for pname, pid in ids.items():
+        xx, _ = swe.calc_ut(jd, pid, flags)
+        lon = (xx[0] + 180) % 360 if pname == 'Ketu' else xx[0]
+        rows.append((pname, lon, xx[1], xx[3]))
+    sun_lon = next((lon for pname, lon, _, _ in rows if pname == 'Sun'), None)
+
     planets = []
-    sun_lon = None
-    for pname, pid in PLANET_IDS.items():
-        if pname in ['Rahu', 'Ketu']:
-            pid = swe.TRUE_NODE if node_mode == 'true' else swe.MEAN_NODE
-        xx, rf = swe.calc_ut(jd, pid, flags)
-        lon, lat, dist = xx[0], xx[1], xx[2]
-        lon_spd = xx[3]
-        if pname == 'Ketu':
-            lon = (lon + 180) % 360
-        if pname == 'Sun' and sun_lon is None:
-            sun_lon = lon
-        sign = get_sign(lon)
+    for pname, lon, lat, lon_spd in rows:
+        sign = ZODIAC_SIGNS[int(lon // 30) % 12]
         deg_in_sign = lon % 30
-        nk = get_nakshatra(lon)
-        retro = lon_spd < 0
-        avastha = get_avastha(deg_in_sign, sign)
+        nk_idx = int(lon / NAK_WIDTH) % 27
+        pada = min(4, int((lon - nk_idx * NAK_WIDTH) * 4 / NAK_WIDTH) + 1)
+        retro = lon_spd < 0 and pname not in RETRO_EXEMPT
         planets.append({
             'name': pname,
             'longitude': lon,
@@ -156,40 +236,41 @@ def calc_planets(jd: float, profile: Optional[str], node_mode: str, tropical: bo
             'longitudeDMS': to_dms(lon),
             'sign': sign,
             'signLord': SIGN_LORDS[sign],
-            'nakshatra': nk['name'],
-            'nakshatraLord': nk['lord'],
-            'nakshatraPada': nk['pada'],
+            'nakshatra': NAK_NAMES[nk_idx],
+            'nakshatraLord': NAK_LORDS[nk_idx],
+            'nakshatraPada': pada,
             'house': 0,
-            'isRetrograde': retro and pname not in ['Sun', 'Moon'],
-            'isCombust': False,
-            'avastha': avastha,
+            'isRetrograde': retro,
+            'isCombust': pname != 'Sun' and sun_lon is not None and is_combust(pname, lon, sun_lon, retro),
+            'avastha': get_avastha(deg_in_sign, sign),
             'houseStatus': None,
         })
-    if sun_lon is not None:
-        for p in planets:
-            if p['name'] != 'Sun':
-                p['isCombust'] = is_combust(p['name'], p['longitude'], sun_lon, p['isRetrograde'])
-    return planets
+    return tuple(planets)
+
+
+@lru_cache(maxsize=2048)
+def _houses_ex(jd: float, lat: float, lon: float, hsys: bytes, hflags: int):
+    return swe.houses_ex(jd, lat, lon, hsys, hflags)
 
 
 def calc_houses(jd: float, lat: float, lon: float, planets: list, house_system: str, tropical: bool = False):
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    ensure_sidereal_mode()
     hsys = (house_system or 'P').encode('ascii')
     hflags = 0 if tropical else swe.FLG_SIDEREAL
-    cusps, ascmc = swe.houses_ex(jd, lat, lon, hsys, hflags)
+    cusps, ascmc = _houses_ex(jd, lat, lon, hsys, hflags)
     asc_deg = ascmc[0]
     asc_sign = get_sign(asc_deg)
     asc_nk = get_nakshatra(asc_deg)
 
     if house_system == 'W':
-        asc_idx = ZODIAC_SIGNS.index(asc_sign)
+        asc_idx = SIGN_TO_IDX[asc_sign]
         hs = []
         for i in range(12):
             sidx = (asc_idx + i) % 12
             sname = ZODIAC_SIGNS[sidx]
             hs.append({'number': i + 1, 'sign': sname, 'signLord': SIGN_LORDS[sname], 'degree': sidx * 30, 'planets': []})
         for p in planets:
-            psidx = ZODIAC_SIGNS.index(p['sign'])
+            psidx = SIGN_TO_IDX[p['sign']]
             hnum = ((psidx - asc_idx + 12) % 12) + 1
             p['house'] = hnum
             hs[hnum - 1]['planets'].append(p['name'])
@@ -201,24 +282,66 @@ def calc_houses(jd: float, lat: float, lon: float, planets: list, house_system:
             cusps12 = cusps_list[0:12]
 
         hs = []
+        signs = ZODIAC_SIGNS
         for i in range(12):
             cusp = cusps12[i]
-            sname = get_sign(cusp)
-            plist = []
-            nxt = cusps12[(i + 1) % 12]
+            sname = signs[int(cusp // 30) % 12]
+            hs.append({'number': i + 1, 'sign': sname, 'signLord': SIGN_LORDS[sname], 'degree': cusp, 'planets': []})
+
+        # Cusps normally increase around the circle with a single wrap past 0°, so the
+        # houses partition the zodiac and a planet's house is the last cusp at or below it.
+        order = sorted(range(12), key=cusps12.__getitem__)
+        starts = [cusps12[i] for i in order]
+        partitioned = all(order[k] == (order[0] + k) % 12 for k in range(12)) and \
+            all(a < b for a, b in zip(starts, starts[1:]))
+        if partitioned:
             for p in planets:
-                inside = (p['longitude'] >= cusp and p['longitude'] < nxt) if nxt > cusp else (p['longitude'] >= cusp or p['longitude'] < nxt)
-                if inside:
-                    plist.append(p['name'])
-                    p['house'] = i + 1
-            hs.append({'number': i + 1, 'sign': sname, 'signLord': SIGN_LORDS[sname], 'degree': cusp, 'planets': plist})
+                i = order[bisect_right(starts, p['longitude']) - 1]
+                hs[i]['planets'].append(p['name'])
+                p['house'] = i + 1
+        else:
+            # Degenerate cusps (e.g. near the poles) can overlap; keep the sector-by-sector scan.
+            for i in range(12):
+                cusp = cusps12[i]
+                nxt = cusps12[(i + 1) % 12]
+                for p in planets:
+                    inside = (p['longitude'] >= cusp and p['longitude'] < nxt) if nxt > cusp else (p['longitude'] >= cusp or p['longitude'] < nxt)
+                    if inside:
+                        hs[i]['planets'].append(p['name'])
+                        p['house'] = i + 1
 
     asc = {'sign': asc_sign, 'degree': asc_deg, 'nakshatra': asc_nk['name'], 'nakshatraLord': asc_nk['lord']}
     cusps_out = list(cusps)[1:13] if len(list(cusps)) >= 13 else list(cusps)[0:12]
     return {'houses': hs, 'ascendant': asc, 'cusps': cusps_out}
 
 
-def planet_status(name: str, sign: str) -> str:
+@lru_cache(maxsize=1024)
+def _compute_chart_cached(date_str: str, time_str: str, tz_name: str, lat: float, lon: float,
+                          node_mode: str, house_system: str, profile: Optional[str], tropical: bool) -> tuple:
+    jd = to_julian(date_str, time_str, tz_name)
+    planets = calc_planets(jd, profile, node_mode, tropical=tropical)
+    house_data = calc_houses(jd, lat, lon, planets, house_system, tropical=tropical)
+    return jd, tuple(planets), house_data
+
+
+def compute_chart(date_str: str, time_str: str, tz_name: str, lat: float, lon: float,
+                  node_mode: str = 'mean', house_system: str = 'W', profile: Optional[str] = None,
+                  tropical: bool = False):
+    """Julian day, planets (with houses assigned) and house data for a birth chart.
+
+    Results are memoised per birth input; callers get fresh copies they may modify.
+    """
+    jd, planets, house_data = _compute_chart_cached(date_str, time_str, tz_name, lat, lon,
+                                                    node_mode, house_system, profile, tropical)
+    houses = {
+        'houses': [{**h, 'planets': list(h['planets'])} for h in house_data['houses']],
+        'ascendant': dict(house_data['ascendant']),
+        'cusps': list(house_data['cusps']),
+    }
+    return jd, [dict(p) for p in planets], houses
+
+
+def _classify_dignity(name: str, sign: str) -> str:
     props = PLANET_PROPS.get(name)
     if not props:
         return 'Neutral'
@@ -238,14 +361,24 @@ def planet_status(name: str, sign: str) -> str:
     return 'Neutral'
 
 
+# Every (planet, sign) dignity, resolved once; planets outside PLANET_PROPS are always Neutral.
+DIGNITY_TABLE: Dict[tuple, str] = {(n, sg): _classify_dignity(n, sg) for n in PLANET_PROPS for sg in ZODIAC_SIGNS}
+
+
+def planet_status(name: str, sign: str) -> str:
+    status = DIGNITY_TABLE.get((name, sign))
+    return status if status is not None else _classify_dignity(name, sign)
+
+
+# Panchang and sunrise-based lookups ask for the same day and place repeatedly; the result is an immutable tuple.
+@lru_cache(maxsize=4096)
 def sunrise_sunset(date_str: str, tz_name: str, lat: float, lon: float):
     if not -90 <= lat <= 90 or not -180 <= lon <= 180:
         return None, None, None, None
     try:
-        tz = pytz.timezone(tz_name)
-        dt_local = tz.localize(parser.parse(f"{date_str} 00:00"))
-        dt_utc = dt_local.astimezone(pytz.utc)
-        jd0 = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour + dt_utc.minute / 60)
+        tz = get_timezone(tz_name)
+        dt_utc = parse_local(date_str, "00:00", tz_name).astimezone(timezone.utc)
+        jd0 = julday(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour + dt_utc.minute / 60)
 
         rsmi_rise = swe.CALC_RISE | swe.BIT_DISC_CENTER
         rsmi_set = swe.CALC_SET | swe.BIT_DISC_CENTER
@@ -268,7 +401,7 @@ def sunrise_sunset(date_str: str, tz_name: str, lat: float, lon: float):
             y, m, d, ut = swe.revjul(jdut)
             hh = int(ut)
             mm = int(round((ut - hh) * 60))
-            dt = datetime(y, m, d, hh, mm, tzinfo=pytz.utc).astimezone(tz)
+            dt = datetime(y, m, d, hh, mm, tzinfo=timezone.utc).astimezone(tz)
             return dt.strftime('%H:%M')
 
         return to_local_str(sr_jdut), to_local_str(ss_jdut), sr_jdut, ss_jdut
@@ -277,18 +410,39 @@ def sunrise_sunset(date_str: str, tz_name: str, lat: float, lon: float):
         return None, None, None, None
 
 
-def panchang_at_jd(jd: float) -> Dict[str, Any]:
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+def panchang_at_jd(jd: float, sun_lon: Optional[float] = None, moon_lon: Optional[float] = None) -> Dict[str, Any]:
+    """Panchang elements at jd; pass sidereal Sun/Moon longitudes already computed for jd to skip the ephemeris."""
+    if sun_lon is not None and moon_lon is not None:
+        return _panchang_from_longitudes(sun_lon, moon_lon)
+    # compute_panchang extends the result in place, so never return the cached dict itself.
+    return dict(_panchang_at_jd_cached(jd))
+
+
+@lru_cache(maxsize=8192)
+def _panchang_at_jd_cached(jd: float) -> Dict[str, Any]:
+    ensure_sidereal_mode()
     xs, _ = swe.calc_ut(jd, swe.SUN, swe.FLG_SIDEREAL | swe.FLG_SWIEPH)
     xm, _ = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL | swe.FLG_SWIEPH)
-    s_lon = xs[0]
+    return _panchang_from_longitudes(xs[0], xm[0])
+
+
+@lru_cache(maxsize=2048)
+def moon_sidereal(jd: float) -> Tuple[str, str, int]:
+    """Sidereal Moon (sign, nakshatra, pada) at jd, e.g. for sunrise-based vedic properties."""
+    ensure_sidereal_mode()
+    xm, _ = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL | swe.FLG_SWIEPH)
     m_lon = xm[0]
+    m_nk = get_nakshatra(m_lon)
+    return get_sign(m_lon), m_nk['name'], m_nk['pada']
+
+
+def _panchang_from_longitudes(s_lon: float, m_lon: float) -> Dict[str, Any]:
     diff = (m_lon - s_lon) % 360.0
     tithi_num = int(diff // 12) + 1
     tithi_name = TITHI_NAMES[tithi_num - 1]
     paksha = 'Shukla' if tithi_num <= 15 else 'Krishna'
     nk = get_nakshatra(m_lon)
-    nk_num = next((i + 1 for i, (n, *_rest) in enumerate(NAKSHATRAS) if n == nk['name']), None)
+    nk_num = nk['number']
     yoga_sum = (s_lon + m_lon) % 360.0
     yoga_num = int(yoga_sum // 13.333333) + 1
     yoga_name = YOGA_NAMES[(yoga_num - 1) % 27]
@@ -307,9 +461,11 @@ def panchang_at_jd(jd: float) -> Dict[str, Any]:
     }
 
 
-def compute_panchang(date_str: str, time_str: str, tz: str, lat: float, lon: float) -> Dict[str, Any]:
+def compute_panchang(date_str: str, time_str: str, tz: str, lat: float, lon: float,
+                     sun_lon: Optional[float] = None, moon_lon: Optional[float] = None) -> Dict[str, Any]:
+    """sun_lon/moon_lon are sidereal longitudes at the birth moment, reused if sunrise cannot be found."""
     jd = to_julian(date_str, time_str, tz)
     sr, ss, sr_jd, _ = sunrise_sunset(date_str, tz, lat, lon)
-    core = panchang_at_jd(sr_jd if sr_jd else jd)
+    core = panchang_at_jd(sr_jd) if sr_jd else panchang_at_jd(jd, sun_lon, moon_lon)
     core.update({'sunrise': sr, 'sunset': ss})
     return core
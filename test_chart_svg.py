@@ -2,75 +2,92 @@
 """
 Test workflow for chart SVG generation:
 1. Call /api/kundli to get computed planet and house data
-2. Pass that data to /chart/svg to generate SVG image
+2. Call /chart/svg with the same birth details to generate the SVG image
+
+Both requests run in-process through FastAPI's TestClient (no server or curl needed).
+Set API_KEY to a valid key for the protected endpoints.
+
+Usage: python test_chart_svg.py [output.svg]   (defaults to chart_optimized.svg in the temp dir)
 """
-import subprocess
-import json
-
-BASE_URL = "http://127.0.0.1:5055"
-
-# Step 1: Get kundli data (planet positions, houses, ascendant)
-kundli_request = {
-    "dateOfBirth": "1990-05-15",
-    "timeOfBirth": "14:30",
-    "latitude": 28.6139,
-    "longitude": 77.2090,
-    "timezone": "Asia/Kolkata",
-    "houseSystem": "W",
-    "nodeMode": "mean"
-}
-
-print("📊 Step 1: Fetching kundli data from /api/kundli...")
-result = subprocess.run([
-    'curl', '-s', '-X', 'POST',
-    f'{BASE_URL}/api/kundli',
-    '-H', 'Content-Type: application/json',
-    '-d', json.dumps(kundli_request)
-], capture_output=True, text=True)
-
-kundli_response = json.loads(result.stdout)
-kundli_data = kundli_response['data']
-
-print(f"✅ Got {len(kundli_data['planets'])} planets")
-print(f"✅ Ascendant: {kundli_data['basicDetails']['ascendant']['sign']} at {kundli_data['basicDetails']['ascendant']['degree']:.2f}°")
-
-# Step 2: Generate SVG chart from the computed data
-chart_request = {
-    "planets": kundli_data["planets"],
-    "ascendant": kundli_data["basicDetails"]["ascendant"],
-    "width": 600,
-    "height": 600,
-    "theme": "dark",
-    "includeOuterPlanets": False
-}
-
-print("\n🎨 Step 2: Generating SVG chart from /chart/svg...")
-result2 = subprocess.run([
-    'curl', '-s', '-X', 'POST',
-    f'{BASE_URL}/chart/svg',
-    '-H', 'Content-Type: application/json',
-    '-d', json.dumps(chart_request)
-], capture_output=True, text=True)
-
-svg_content = result2.stdout
-
-if svg_content.startswith('<?xml') or svg_content.startswith('<svg'):
-    print(f"✅ Generated SVG ({len(svg_content)} bytes)")
-    
-    # Save to file
-    output_file = "chart_optimized.svg"
-    with open(output_file, "w") as f:
-        f.write(svg_content)
-    print(f"✅ Saved to {output_file}")
-    
-    # Show first few lines
-    print("\n📄 SVG preview:")
-    lines = svg_content.split('\n')
-    for i, line in enumerate(lines[:8]):
-        print(f"  {line[:100]}{'...' if len(line) > 100 else ''}")
-else:
-    print(f"❌ Error response:")
-    print(svg_content[:500])
-
-print("\n✨ Workflow complete! No duplicate calculations.")
-print("💡 Frontend should: /api/kundli → store data → /chart/svg when needed")
+import os
+import sys
+import tempfile
+
+
+def main(output_file):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    headers = {"X-API-Key": os.environ.get("API_KEY", "")}
+
+    # Step 1: Get kundli data (planet positions, houses, ascendant)
+    kundli_request = {
+        "dateOfBirth": "1990-05-15",
+        "timeOfBirth": "14:30",
+        "latitude": 28.6139,
+        "longitude": 77.2090,
+        "timezone": "Asia/Kolkata",
+        "houseSystem": "W",
+        "nodeMode": "mean"
+    }
+
+    print("📊 Step 1: Fetching kundli data from /api/kundli...")
+    result1 = client.post('/api/kundli', json=kundli_request, headers=headers)
+    if result1.status_code != 200:
+        print(f"❌ /api/kundli returned {result1.status_code}: {result1.text[:500]}")
+        return 1
+    kundli_data = result1.json()['data']
+
+    print(f"✅ Got {len(kundli_data['planets'])} planets")
+    print(f"✅ Ascendant: {kundli_data['basicDetails']['ascendant']['sign']} at {kundli_data['basicDetails']['ascendant']['degree']:.2f}°")
+
+    # Step 2: Generate SVG chart; the ephemeris results from step 1 are reused from the in-process caches
+    chart_request = {
+        **kundli_request,
+        "width": 600,
+        "height": 600,
+        "theme": "dark",
+        "includeOuterPlanets": False
+    }
+
+    print("\n🎨 Step 2: Generating SVG chart from /chart/svg...")
+    # Stream the body straight to disk, then read back only what the preview needs
+    with client.stream('POST', '/chart/svg', json=chart_request, headers=headers) as result2:
+        if result2.status_code != 200:
+            result2.read()
+            print(f"❌ /chart/svg returned {result2.status_code}: {result2.text[:500]}")
+            return 1
+        with open(output_file, "wb") as f:
+            for chunk in result2.iter_bytes():
+                f.write(chunk)
+
+    with open(output_file, "r", encoding="utf-8") as f:
+        preview = [f.readline() for _ in range(8)]
+        svg_size = os.path.getsize(output_file)
+
+    if preview[0].startswith('<?xml') or preview[0].startswith('<svg'):
+        print(f"✅ Generated SVG ({svg_size} bytes)")
+        print(f"✅ Saved to {output_file}")
+
+        # Show first few lines
+        print("\n📄 SVG preview:")
+        for line in preview:
+            if not line:
+                break
+            line = line.rstrip('\n')
+            print(f"  {line[:100]}{'...' if len(line) > 100 else ''}")
+    else:
+        print(f"❌ Error response:")
+        print(''.join(preview)[:500])
+        os.remove(output_file)
+        return 1
+
+    print("\n✨ Workflow complete! No duplicate calculations.")
+    print("💡 /chart/svg takes the same birth details as /api/kundli; no need to pass kundli data along")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1] if len(sys.argv) > 1 else os.path.join(tempfile.gettempdir(), "chart_optimized.svg")))
@@ -0,0 +1,57 @@
+"""Test in-process caching of chart computations."""
+
+import pytest
+
+pytestmark = pytest.mark.nodb
+
+from app.cache import TTLCache
+from app.utils import calc_planets, compute_chart, panchang_at_jd, to_julian
+
+
+class TestTTLCache:
+    def test_get_set(self):
+        c = TTLCache(maxsize=4, ttl=60)
+        assert c.get("a") is None
+        c.set("a", 1)
+        assert c.get("a") == 1
+
+    def test_evicts_least_recently_used(self):
+        c = TTLCache(maxsize=2, ttl=60)
+        c.set("a", 1)
+        c.set("b", 2)
+        c.get("a")
+        c.set("c", 3)
+        assert c.get("a") == 1
+        assert c.get("b") is None
+        assert c.get("c") == 3
+
+    def test_expired_entries_are_dropped(self):
+        c = TTLCache(maxsize=2, ttl=-1)
+        c.set("a", 1)
+        assert c.get("a") is None
+
+
+class TestCachedComputations:
+    def test_calc_planets_returns_independent_copies(self):
+        jd = to_julian("1990-05-15", "14:30", "Asia/Kolkata")
+        first = calc_planets(jd, None, 'mean')
+        first[0]['house'] = 99
+        second = calc_planets(jd, None, 'mean')
+        assert second[0]['house'] == 0
+        assert [p['longitude'] for p in first] == [p['longitude'] for p in second]
+
+    def test_panchang_at_jd_returns_independent_copies(self):
+        jd = to_julian("2025-06-15", "12:00", "Asia/Kolkata")
+        p = panchang_at_jd(jd)
+        p['sunrise'] = '06:00'
+        assert 'sunrise' not in panchang_at_jd(jd)
+
+    def test_compute_chart_returns_independent_copies(self):
+        args = ("1990-05-15", "14:30", "Asia/Kolkata", 28.6139, 77.2090)
+        jd, planets, houses = compute_chart(*args)
+        assert jd == to_julian(*args[:3])
+        planets[0]['house'] = 99
+        houses['houses'][0]['planets'].append('X')
+        _, planets2, houses2 = compute_chart(*args)
+        assert planets2[0]['house'] != 99
+        assert 'X' not in houses2['houses'][0]['planets']
@@ -5,7 +5,8 @@ import pytest
 
 pytestmark = pytest.mark.nodb
 
-from app.response import success, error, not_found, validation_error
+from app import cache
+from app.response import success, error, not_found, validation_error, cached_json
 
 
 class TestResponse:
@@ -44,3 +45,35 @@ class TestResponse:
         assert r.status_code == 422
         body = self._parse(r)
         assert body["success"] is False
+
+
+class TestCachedJson:
+    @pytest.fixture
+    def store(self, monkeypatch):
+        data = {}
+        monkeypatch.setattr(cache, "get", data.get)
+        monkeypatch.setattr(cache, "set", lambda key, value, ttl=300: data.__setitem__(key, value))
+        return data
+
+    def test_miss_builds_and_stores_body(self, store):
+        r = cached_json("k", lambda: {"status": 200, "data": [1, 2]})
+        assert json.loads(r.body) == {"status": 200, "data": [1, 2]}
+        assert json.loads(store["k"]) == {"status": 200, "data": [1, 2]}
+
+    def test_hit_returns_stored_body_without_building(self, store):
+        store["k"] = '{"status":200,"data":"cached"}'
+
+        def build():
+            raise AssertionError("should not rebuild on a hit")
+
+        r = cached_json("k", build)
+        assert r.body == b'{"status":200,"data":"cached"}'
+        assert r.media_type == "application/json"
+
+    def test_redis_unavailable_builds_every_time(self, monkeypatch):
+        monkeypatch.setattr(cache, "get", lambda key: None)
+        monkeypatch.setattr(cache, "set", lambda key, value, ttl=300: False)
+        calls = []
+        cached_json("k", lambda: calls.append(1) or {})
+        cached_json("k", lambda: calls.append(1) or {})
+        assert len(calls) == 2
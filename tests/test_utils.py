@@ -0,0 +1,75 @@
+"""Test core astrology helpers."""
+
+import pytest
+
+pytestmark = pytest.mark.nodb
+
+import threading
+from datetime import datetime, timedelta
+
+import swisseph as swe
+
+from app.utils import get_nakshatra, localize, parse_local, calc_houses, to_dms, NAKSHATRAS
+
+
+class TestNakshatra:
+    def test_first_and_last(self):
+        assert get_nakshatra(0.0) == {'name': 'Ashwini', 'lord': 'Ketu', 'pada': 1, 'number': 1}
+        assert get_nakshatra(359.99)['name'] == 'Revati'
+        assert get_nakshatra(359.99)['pada'] == 4
+
+    def test_matches_table(self):
+        for i, (name, lord, start, end) in enumerate(NAKSHATRAS):
+            nk = get_nakshatra((start + end) / 2)
+            assert nk['name'] == name
+            assert nk['lord'] == lord
+            assert nk['number'] == i + 1
+
+    def test_padas(self):
+        width = 360.0 / 27.0
+        assert [get_nakshatra(width * (k + 0.5) / 4)['pada'] for k in range(4)] == [1, 2, 3, 4]
+
+    def test_wraps_full_circle(self):
+        assert get_nakshatra(360.5) == get_nakshatra(0.5)
+
+
+class TestToDms:
+    def test_basic(self):
+        assert to_dms(12.5) == "12°30′0″"
+        assert to_dms(-0.25) == "-0°15′0″"
+
+    def test_rounded_seconds_carry(self):
+        assert to_dms(5.0 + 59.9999 / 60) == "6°0′0″"
+        assert to_dms(5.0 + 3 / 60 + 59.9 / 3600) == "5°4′0″"
+
+
+class TestLocalize:
+    def test_fixed_offset_zone(self):
+        assert localize(datetime(1990, 5, 15, 14, 30), "Asia/Kolkata").utcoffset() == timedelta(hours=5, minutes=30)
+
+    def test_ambiguous_time_resolves_to_standard(self):
+        dt = localize(datetime(2024, 11, 3, 1, 30), "America/New_York")
+        assert dt.utcoffset() == timedelta(hours=-5)
+
+    def test_missing_time_resolves_to_standard(self):
+        dt = localize(datetime(2024, 3, 10, 2, 30), "America/New_York")
+        assert dt.utcoffset() == timedelta(hours=-5)
+
+    def test_parse_local_accepts_non_iso_time(self):
+        assert parse_local("2024-03-10", "2:30 PM", "Asia/Kolkata").hour == 14
+
+
+class TestSiderealMode:
+    def test_lahiri_in_fresh_thread(self):
+        # Swiss Ephemeris state is per thread; request handlers run in a threadpool.
+        jd = swe.julday(1990, 5, 15, 9.0)
+        result = {}
+
+        def worker():
+            calc_houses(jd, 28.6139, 77.2090, [], 'W')
+            result['ayanamsa'] = swe.get_ayanamsa(jd)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert abs(result['ayanamsa'] - 23.7225) < 0.001